@@ -1,19 +1,20 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
-import streamlit.components.v1 as components
-import glob
 import os
+import csv
+import html
+import math
+import re
+import uuid
 import shutil
-import requests
-from PIL import Image
-from io import BytesIO
+from itertools import islice
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from time import sleep
 from typing import Dict
-import networkx as nx 
 import sys
 import traceback
 
@@ -38,14 +39,70 @@ def ensure_directories_exist():
             except Exception as e:
                 print(f"Error creating directory {directory}: {e}")
 
-def safe_load_csv(file_path, default_columns=None):
+def read_csv_fast(file_path, **kwargs):
     """
-    Safely load a CSV file with error handling.
+    Read a CSV with pandas' multithreaded PyArrow engine.
+    Falls back to the default parser if pyarrow isn't available or rejects the file.
+    """
+    try:
+        df = pd.read_csv(file_path, engine='pyarrow', **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(file_path, **kwargs)
+    if df.empty:
+        # pyarrow types the columns of a header-only file as float64; the default
+        # parser gives object, which callers rely on for the .str accessor
+        df = df.astype({column: object for column in df.columns if df[column].dtype == 'float64'})
+    return df
+
+def read_csv_snapshot(file_path, filters=None, **kwargs):
+    """
+    Read a CSV through a Parquet snapshot stored next to it.
+    The CSV stays the source of truth: the snapshot records the CSV's mtime and size
+    and is rebuilt from the CSV whenever they no longer match.
+    Optional pyarrow `filters` are pushed down into the Parquet read.
+    """
+    snapshot_path = os.path.splitext(file_path)[0] + '.parquet'
+    source = csv_source(file_path)
+    
+    if os.path.exists(snapshot_path):
+        try:
+            df = pd.read_parquet(snapshot_path, filters=filters)
+            if df.attrs.get('source') == source:
+                return df
+        except Exception:
+            pass
+    
+    df = read_csv_fast(file_path, **kwargs)
+    try:
+        write_snapshot(file_path, df, source)
+        if filters:
+            return pd.read_parquet(snapshot_path, filters=filters)
+    except Exception as e:
+        print(f"Could not write snapshot {snapshot_path}: {e}")
+    return df
+
+def csv_source(file_path):
+    """The [mtime_ns, size] stamp a snapshot must match to stand in for its CSV."""
+    stat = os.stat(file_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def write_snapshot(file_path, df, source=None):
+    """
+    Store df as the Parquet snapshot of file_path, stamped with the CSV's current
+    mtime and size unless a stamp is given. df must match what reading the CSV returns.
+    """
+    df.attrs['source'] = source if source is not None else csv_source(file_path)
+    df.to_parquet(os.path.splitext(file_path)[0] + '.parquet', index=False,
+                  compression='zstd', row_group_size=64_000)
+
+def safe_load_csv(file_path, default_columns=None, dtypes=None):
+    """
+    Safely load a CSV file (through its Parquet snapshot) with error handling.
     Returns an empty DataFrame with default columns if the file doesn't exist or can't be read.
     """
     try:
         if os.path.exists(file_path):
-            return pd.read_csv(file_path)
+            return read_csv_snapshot(file_path, dtype=dtypes)
         else:
             st.warning(f"File not found: {file_path}")
             if default_columns:
@@ -61,6 +118,9 @@ def safe_load_csv(file_path, default_columns=None):
 try:
     # Ensure all required directories exist
     ensure_directories_exist() 
+except Exception as e:
+    print(f"An error occurred during application startup: {e}")
+    traceback.print_exc()
 
 # Check if App is Running Locally or on Streamlit's Servers
 def is_running_on_streamlit():
@@ -69,7 +129,7 @@ def is_running_on_streamlit():
 # Use this flag to control feedback buttons
 IS_LOCAL = not is_running_on_streamlit()
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def load_nuked_albums():
     """
     Load the list of nuked albums from the CSV file.
@@ -84,185 +144,102 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def load_css():
+    """
+    Read the app stylesheet once per server process instead of on every rerun.
+    """
+    with open('graphics/style.css', 'r', encoding='utf-8') as f:
+        return f"<style>{f.read()}</style>"
+
 # Custom CSS for both notebook content and general styling
-st.markdown("""
-    <style>
-    .notebook-content {
-        text-align: left;
-        margin-left: 0px;
-        padding-left: 0px;
-        width: 100%;
-    }
-    .prediction-card {
-        padding: 20px;
-        border-radius: 10px;
-        border: 1px solid #e0e0e0;
-        background-color: #ffffff;
-    }
-    .similar-artists {
-        font-style: italic;
-        color: #666;
-        margin-top: 5px;
-    }
-    .stMarkdown {
-        text-align: left !important;
-    }
-    .block-container {
-        padding-left: 2rem;
-        padding-right: 2rem;
-    }
-    .spotify-button {
-        background-color: #f8f9fa;
-        color: #1e1e1e;
-        padding: 8px 16px;
-        border-radius: 4px;
-        text-decoration: none;
-        font-size: 0.9rem;
-        display: inline-block;
-        margin-top: 10px;
-        border: 1px solid rgba(0, 0, 0, 0.1);
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        transition: all 0.3s ease;
-    }
-    .spotify-button:hover {
-        background-color: #ffffff;
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.15);
-        transform: translateY(-1px);
-        text-decoration: none;
-        color: #1e1e1e;
-    }
-    .album-container {
-        background-color: #ffffff;
-        border-radius: 10px;
-        padding: 20px;
-        margin-bottom: 20px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-    .metric-container {
-        background-color: #f8f9fa;
-        padding: 10px;
-        border-radius: 8px;
-        text-align: center;
-    }
-    .public-rating-buttons {
-        display: flex;
-        gap: 5px;
-        margin-top: 5px;
-        flex-wrap: nowrap;  /* Changed from wrap to nowrap */
-        justify-content: space-between;  /* Distribute buttons evenly */
-    }
-
-    .public-rating-buttons button {
-        flex: 1;
-        min-width: 40px;  /* Reduced from 60px for better mobile fit */
-        padding: 8px 12px;
-        font-size: 0.9rem;
-    }
-
-    /* Light gray background for username input */
-    .stTextInput>div>div>input {
-        background-color: #f8f9fa !important;  /* Light gray */
-        border-radius: 4px;
-        padding: 8px;
-    }
-
-    /* Light gray background for feedback buttons */
-    .stButton>button {
-        background-color: #f8f9fa !important;  /* Light gray */
-        border: 1px solid #e0e0e0 !important;  /* Light gray border */
-        color: #333 !important;  /* Darker text for better contrast */
-        border-radius: 4px;
-        transition: all 0.3s ease;
-    }
-
-    /* Hover effect for feedback buttons */
-    .stButton>button:hover {
-        background-color: #e9ecef !important;  /* Slightly darker gray on hover */
-        border-color: #ced4da !important;  /* Darker gray border on hover */
-        color: #000 !important;  /* Black text on hover for better contrast */
-    }
-
-    /* Light gray background for the review text area */
-    .stTextArea>div>div>textarea {
-        background-color: #f8f9fa !important;  /* Light gray */
-        border-radius: 4px;
-        padding: 8px;
-    }
-
-    /* Light gray background for the feedback section container */
-    .feedback-container {
-        background-color: #f8f9fa !important;  /* Light gray */
-        padding: 10px;
-        border-radius: 8px;
-        margin-top: 10px;
-    }
-
-
-
-    .archive-selector {
-        margin-bottom: 20px;
-        padding: 10px;
-        background-color: #f8f9fa;
-        border-radius: 8px;
-    }
-    .archive-button {
-        background-color: #f8f9fa;
-        color: #1e1e1e;
-        padding: 5px 10px;
-        border-radius: 4px;
-        text-decoration: none;
-        font-size: 0.9rem;
-        border: 1px solid rgba(0, 0, 0, 0.1);
-        margin-right: 5px;
-    }
-    .archive-button:hover {
-        background-color: #ffffff;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    </style>
-""", unsafe_allow_html=True)
+try:
+    st.markdown(load_css(), unsafe_allow_html=True)
+except OSError as e:
+    print(f"Error loading graphics/style.css: {e}")
 
 
-@st.cache_data
+def parse_prediction_date(file_name):
+    """
+    Parse the MM-DD-YY prefix of a prediction file name by slicing, which is much
+    cheaper than strptime. Raises ValueError for names without a valid date prefix.
+    """
+    date_str = os.path.basename(file_name)[:8]
+    if len(date_str) != 8 or date_str[2] != '-' or date_str[5] != '-':
+        raise ValueError(f"No MM-DD-YY prefix in {file_name}")
+    return datetime(2000 + int(date_str[6:8]), int(date_str[0:2]), int(date_str[3:5]))
+
+@st.cache_data(show_spinner=False)
+def _list_prediction_files(dir_mtime):
+    """
+    List prediction files with a single directory scan and parse each date prefix once.
+    Returns (path, date, ISO date string) tuples. Keyed on the predictions directory's
+    mtime, which changes whenever a file is added, removed or renamed.
+    """
+    file_dates = []
+    if not os.path.isdir('predictions'):
+        return file_dates
+    
+    with os.scandir('predictions') as entries:
+        for entry in entries:
+            if not entry.name.endswith('_Album_Recommendations.csv') or not entry.is_file():
+                continue
+            try:
+                date_obj = parse_prediction_date(entry.name)
+            except ValueError:
+                # Skip files with invalid date format
+                continue
+            file_dates.append((os.path.join('predictions', entry.name), date_obj, date_obj.strftime('%Y-%m-%d')))
+    return file_dates
+
+def list_prediction_files():
+    return _list_prediction_files(file_mtime('predictions'))
+
 def get_all_prediction_files():
+    return _prediction_file_dates(file_mtime('predictions'))
+
+@st.cache_data
+def _prediction_file_dates(dir_mtime):
     """
     Get all prediction files and their corresponding dates.
+    Returns (path, date, display date, ISO date) tuples, newest first.
     """
-    prediction_files = glob.glob('predictions/*_Album_Recommendations.csv')
+    prediction_files = _list_prediction_files(dir_mtime)
     if not prediction_files:
         st.error("No prediction files found!")
         return []
     
-    # Sort files by date (newest first)
-    file_dates = []
-    for file in prediction_files:
-        date_str = os.path.basename(file).split('_')[0]
-        try:
-            date_obj = datetime.strptime(date_str, '%m-%d-%y')
-            formatted_date = date_obj.strftime('%B %d, %Y')
-            file_dates.append((file, date_obj, formatted_date))
-        except ValueError:
-            # Skip files with invalid date format
-            continue
+    file_dates = [
+        (file, date_obj, date_obj.strftime('%B %d, %Y'), date_iso)
+        for file, date_obj, date_iso in prediction_files
+    ]
     
     # Sort by date (newest first)
     file_dates.sort(key=lambda x: x[1], reverse=True)
     return file_dates
 
-@st.cache_data
-def load_predictions(file_path=None):
+@st.cache_data(show_spinner=False)
+def load_predictions(file_path=None, analysis_date=None):
     """
     Load the predictions data from a specific file or the latest file if none specified.
+    `analysis_date` is the file's ISO date when the caller already has it.
     """
     if file_path is None:
-        prediction_files = glob.glob('predictions/*_Album_Recommendations.csv')
+        prediction_files = list_prediction_files()
         if not prediction_files:
             st.error("No prediction files found!")
             return None
         
-        file_path = max(prediction_files)
+        # Latest release week
+        file_path, _, analysis_date = max(prediction_files, key=lambda x: x[1])
     
-    predictions_df = pd.read_csv(file_path)
+    predictions_df = read_csv_snapshot(file_path, dtype={
+        'Artist': 'string',
+        'Album Name': 'string',
+        'Genres': 'string',
+        'Label': 'string',
+        'playlist_origin': 'string'
+    })
     
     # Ensure 'playlist_origin' column exists (silently add if missing)
     if 'playlist_origin' not in predictions_df.columns:
@@ -275,24 +252,84 @@ def load_predictions(file_path=None):
     # Remove duplicate albums if any
     predictions_df = predictions_df.drop_duplicates(subset=['Artist', 'Album Name'], keep='first')
     
-    date_str = os.path.basename(file_path).split('_')[0]
-    analysis_date = datetime.strptime(date_str, '%m-%d-%y').strftime('%Y-%m-%d')
+    if analysis_date is None:
+        analysis_date = parse_prediction_date(file_path).strftime('%Y-%m-%d')
     
     return predictions_df, analysis_date
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
+def unique_albums(file_path=None):
+    """
+    Distinct (Artist, Album Name) pairs of a predictions file (the latest if none
+    specified), so the album fixer doesn't recompute them on every keystroke.
+    Lowercased copies (_artist_lc, _album_lc) are included for the search boxes.
+    """
+    predictions_data = load_predictions(file_path)
+    if predictions_data is None:
+        return None
+    df, _ = predictions_data
+    albums = df[['Artist', 'Album Name']].drop_duplicates().reset_index(drop=True)
+    return albums.assign(_artist_lc=albums['Artist'].str.lower(), _album_lc=albums['Album Name'].str.lower())
+
+# Album name keywords that suggest an album for nuking, compiled once
+NUKE_KEYWORDS = ("Live", "Deluxe", "Reissue", "Anniversary")
+NUKE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, NUKE_KEYWORDS)), re.IGNORECASE)
+
+# Quick search buttons in the album fixer's search boxes
+QUICK_SEARCH_TERMS = ("Live", "Deluxe", "Reissue")
+
+@st.cache_data(show_spinner=False)
+def keyword_matches(file_path=None):
+    """
+    Albums from unique_albums() whose name contains any of the NUKE_KEYWORDS.
+    """
+    albums = unique_albums(file_path)
+    if albums is None:
+        return None
+    mask = albums['Album Name'].str.contains(NUKE_KEYWORDS_RE, na=False)
+    return albums.loc[mask, ['Artist', 'Album Name']].reset_index(drop=True)
+
+# Cached loaders are keyed on paths/mtimes, never on DataFrames, so a cache
+# lookup never hashes a frame. Spinners are off: they run inside prefetch_data workers.
+@st.cache_data(show_spinner=False)
 def load_album_covers():
     return safe_load_csv('data/nmf_album_covers.csv', ['Artist', 'Album Name', 'Album Art'])
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def load_album_links():
     return safe_load_csv('data/nmf_album_links.csv', ['Album Name', 'Artist Name(s)', 'Spotify URL'])
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def load_similar_artists():
     return safe_load_csv('data/nmf_similar_artists.csv', ['Artist', 'Similar Artists'])
 
-@st.cache_data
+# Lookup dicts for the album cards. st.cache_resource hands back the same dict on
+# every call instead of copying a DataFrame, so clear these whenever the CSVs change.
+@st.cache_resource(show_spinner=False)
+def album_cover_map():
+    df = load_album_covers().drop_duplicates(subset=['Artist', 'Album Name'], keep='first')
+    return dict(zip(zip(df['Artist'], df['Album Name']), df['Album Art']))
+
+@st.cache_resource(show_spinner=False)
+def album_link_map():
+    df = load_album_links().drop_duplicates(subset=['Album Name', 'Artist Name(s)'], keep='first')
+    return dict(zip(zip(df['Album Name'], df['Artist Name(s)']), df['Spotify URL']))
+
+# Row positions per key in the covers/links frames, for the album fixer's edits
+@st.cache_resource(show_spinner=False)
+def album_cover_rows():
+    return load_album_covers().groupby(['Artist', 'Album Name'], sort=False).indices
+
+@st.cache_resource(show_spinner=False)
+def album_link_rows():
+    return load_album_links().groupby(['Artist Name(s)', 'Album Name'], sort=False).indices
+
+@st.cache_resource(show_spinner=False)
+def similar_artist_map():
+    df = load_similar_artists().drop_duplicates(subset=['Artist'], keep='first')
+    return dict(zip(df['Artist'], df['Similar Artists']))
+
+@st.cache_data(show_spinner=False)
 def load_liked_similar():
     """
     Load the dataset of similar artists for liked artists.
@@ -300,111 +337,125 @@ def load_liked_similar():
     return safe_load_csv('data/liked_artists_only_similar.csv', ['Artist', 'Similar Artists'])
 
 def load_training_data():
-    df = safe_load_csv('data/df_cleaned_pre_standardized.csv')
+    training_file = 'data/df_cleaned_pre_standardized.csv'
+    if not os.path.exists(training_file):
+        return safe_load_csv(training_file)
+    
+    try:
+        # The NMF rows are skipped at the Parquet layer instead of being parsed and then dropped
+        df = read_csv_snapshot(training_file, filters=[('playlist_origin', '!=', 'df_nmf')])
+    except Exception as e:
+        st.error(f"Error loading {training_file}: {e}")
+        return pd.DataFrame()
+    
     if not df.empty and 'playlist_origin' in df.columns:
-        return df[df['playlist_origin'] != 'df_nmf'].copy()
+        # No-op when the filter was pushed down; still needed if the snapshot couldn't be written
+        return df[df['playlist_origin'] != 'df_nmf']
     return df
 
-# Improved feedback functions with better error handling
-def save_feedback(album_name, artist, feedback, review=None):
+def append_csv_rows(file_path, columns, rows, quoting=csv.QUOTE_ALL):
     """
-    Save user feedback on albums with improved error handling for HuggingFace Spaces.
+    Append rows to a CSV, writing the header first if the file is new.
     """
-    feedback_dir = 'feedback'
-    feedback_file = os.path.join(feedback_dir, 'feedback.csv')
-    
-    # Ensure the feedback directory exists
-    if not os.path.exists(feedback_dir):
-        try:
-            os.makedirs(feedback_dir, exist_ok=True)
-        except Exception as e:
-            st.error(f"Error creating feedback directory: {e}")
-            return
-    
-    # Create a dataframe with the new feedback
-    new_feedback = pd.DataFrame({
-        'Album Name': [album_name],
-        'Artist': [artist],
-        'Feedback': [feedback],
-        'Review': [review if review else ""]
-    })
+    write_header = not os.path.exists(file_path) or os.path.getsize(file_path) == 0
+    with open(file_path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, quoting=quoting, lineterminator='\n')
+        if write_header:
+            writer.writerow(columns)
+        writer.writerows(rows)
+
+def append_csv_row(file_path, columns, values, quoting=csv.QUOTE_ALL):
+    """
+    Append a single row to a CSV, writing the header first if the file is new.
+    """
+    append_csv_rows(file_path, columns, [values], quoting)
 
-    # Load existing feedback if file exists
-    if os.path.exists(feedback_file):
+def append_csv_record(file_path, record, quoting=csv.QUOTE_MINIMAL):
+    """
+    Append a dict as one row, in the column order of the file's existing header.
+    Columns missing from the record are left empty.
+    """
+    columns = list(record)
+    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+        with open(file_path, newline='', encoding='utf-8') as f:
+            columns = next(csv.reader(f), columns)
+    append_csv_row(file_path, columns, [record.get(column, '') for column in columns], quoting)
+
+def write_csv_frame(file_path, df, quoting=csv.QUOTE_ALL):
+    """
+    Rewrite a CSV from a DataFrame. QUOTE_ALL files go through pyarrow's C++ CSV writer;
+    everything else, and any frame pyarrow can't convert, uses a buffered csv.writer.
+    The rows go to a temporary file that then replaces the original, so readers never
+    see a partial file. Missing values are written as empty strings, as to_csv would.
+    """
+    tmp_path = file_path + '.tmp'
+    if quoting == csv.QUOTE_ALL:
         try:
-            existing_feedback = pd.read_csv(feedback_file, quoting=1)
-            
-            # Remove existing feedback for this album and artist
-            existing_feedback = existing_feedback[
-                ~((existing_feedback['Album Name'] == album_name) & 
-                  (existing_feedback['Artist'] == artist))
-            ]
-            
-            # Combine with new feedback
-            combined_feedback = pd.concat([existing_feedback, new_feedback], ignore_index=True)
-        except Exception as e:
-            st.warning(f"Error reading existing feedback: {e}. Creating new file.")
-            combined_feedback = new_feedback
-    else:
-        combined_feedback = new_feedback
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, tmp_path, pacsv.WriteOptions(
+                include_header=True, batch_size=1024, quoting_style='all_valid'))
+            os.replace(tmp_path, file_path)
+            return
+        except (ImportError, ValueError, TypeError) as e:
+            # ArrowInvalid/ArrowTypeError subclass these, e.g. for mixed-type object columns
+            print(f"pyarrow CSV write failed for {file_path}, using csv.writer: {e}")
     
-    try:
-        # Save with proper quoting to handle commas in fields
-        combined_feedback.to_csv(feedback_file, index=False, quoting=1)
-        
-        # Clear cache after saving feedback
-        st.cache_data.clear()
-    except Exception as e:
-        st.error(f"Error saving feedback: {e}")
-
-def load_feedback():
-    feedback_file = 'feedback/feedback.csv'
-    return safe_load_csv(feedback_file, ['Album Name', 'Artist', 'Feedback', 'Review'])
-
-def load_public_feedback():
-    feedback_file = 'feedback/public_feedback.csv'
-    return safe_load_csv(feedback_file, ['Album Name', 'Artist', 'Feedback', 'Username', 'Timestamp', 'Review'])
-
-# Updated feedback functions
+    # pyarrow has no QUOTE_MINIMAL: its 'needed' style quotes every string field,
+    # which would rewrite every line of the git-tracked covers/links files
+    rows = df.astype(object).where(df.notna(), '')
+    with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=64 * 1024) as f:
+        writer = csv.writer(f, quoting=quoting, lineterminator='\n')
+        writer.writerow(df.columns)
+        writer.writerows(rows.itertuples(index=False, name=None))
+    os.replace(tmp_path, file_path)
+
+# Feedback functions
 def save_feedback(album_name, artist, feedback, review=None):
+    """
+    Append Mike's feedback for an album. Earlier rows for the same album are
+    superseded at read time (load_feedback keeps the last row per album).
+    """
     feedback_file = 'feedback/feedback.csv'
     if not os.path.exists('feedback'):
         os.makedirs('feedback')
     
-    # Create a dataframe with the new feedback
-    new_feedback = pd.DataFrame({
-        'Album Name': [album_name],
-        'Artist': [artist],
-        'Feedback': [feedback],
-        'Review': [review if review else ""]
-    })
-
-    # Load existing feedback if file exists
-    if os.path.exists(feedback_file):
-        try:
-            # Use proper quoting and escape characters when reading
-            existing_feedback = pd.read_csv(feedback_file, quoting=1)  # QUOTE_ALL
-            
-            # Remove existing feedback for this album and artist
-            existing_feedback = existing_feedback[
-                ~((existing_feedback['Album Name'] == album_name) & 
-                  (existing_feedback['Artist'] == artist))
-            ]
-            
-            # Combine with new feedback
-            combined_feedback = pd.concat([existing_feedback, new_feedback], ignore_index=True)
-        except Exception as e:
-            st.warning(f"Error reading existing feedback: {e}. Creating new file.")
-            # If reading fails, start fresh with just the new feedback
-            combined_feedback = new_feedback
-    else:
-        combined_feedback = new_feedback
-    
     # Save with proper quoting to handle commas in fields
-    combined_feedback.to_csv(feedback_file, index=False, quoting=1)  # QUOTE_ALL
+    append_csv_row(
+        feedback_file,
+        ['Album Name', 'Artist', 'Feedback', 'Review'],
+        [album_name, artist, feedback, review if review and not pd.isna(review) else ""]
+    )
+    
+    # Only the feedback caches are affected by this write
+    _load_feedback_cached.clear()
+    _feedback_index.clear()
+
+# Columns of public_feedback.csv. review_id is a uuid4 stored with each new row;
+# rows saved before it existed get a derived id (see review_ids).
+PUBLIC_FEEDBACK_COLUMNS = ['Album Name', 'Artist', 'Feedback', 'Username', 'Timestamp', 'Review', 'review_id']
+
+def add_csv_column(file_path, column, quoting=csv.QUOTE_ALL):
+    """
+    Add an empty column to an existing CSV, streaming it row by row into a temporary
+    file that replaces the original. No-op if the file is missing or already has it.
+    """
+    if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+        return
+    with open(file_path, newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), [])
+    if column in header:
+        return
     
-    # Clear cache after saving feedback
-    st.cache_data.clear()
+    tmp_path = file_path + '.tmp'
+    with open(file_path, newline='', encoding='utf-8') as src, \
+            open(tmp_path, 'w', newline='', encoding='utf-8', buffering=64 * 1024) as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst, quoting=quoting, lineterminator='\n')
+        writer.writerow(next(reader) + [column])
+        writer.writerows(row + [''] for row in reader)
+    os.replace(tmp_path, file_path)
 
 def save_public_feedback(album_name, artist, feedback, username="Anonymous", review=None):
     feedback_dir = 'feedback'
@@ -418,51 +469,46 @@ def save_public_feedback(album_name, artist, feedback, username="Anonymous", rev
             st.error(f"Error creating feedback directory: {e}")
             return
     
-    # Create a dataframe with the new feedback
-    new_feedback = pd.DataFrame({
-        'Album Name': [album_name],
-        'Artist': [artist],
-        'Feedback': [feedback],
-        'Username': [username],
-        'Timestamp': [datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-        'Review': [review if review else ""]
-    })
-
-    # Load existing feedback if file exists
-    if os.path.exists(feedback_file):
-        try:
-            existing_feedback = pd.read_csv(feedback_file, quoting=1)
-            combined_feedback = pd.concat([existing_feedback, new_feedback], ignore_index=True)
-        except Exception as e:
-            st.warning(f"Error reading existing public feedback: {e}. Creating new file.")
-            combined_feedback = new_feedback
-    else:
-        combined_feedback = new_feedback
-    
     try:
+        # Files written before review ids were stored get the column once
+        add_csv_column(feedback_file, 'review_id')
         # Save with proper quoting to handle commas in fields
-        combined_feedback.to_csv(feedback_file, index=False, quoting=1)
+        append_csv_record(
+            feedback_file,
+            dict(zip(PUBLIC_FEEDBACK_COLUMNS,
+                     [album_name, artist, feedback, username,
+                      datetime.now().strftime("%Y-%m-%d %H:%M:%S"), review if review else "",
+                      uuid.uuid4().hex])),
+            quoting=csv.QUOTE_ALL
+        )
         
-        # Clear cache after saving feedback
-        st.cache_data.clear()
+        # Only the public feedback caches are affected by this write
+        refresh_public_feedback()
     except Exception as e:
         st.error(f"Error saving public feedback: {e}")
 
-# Updated load feedback functions
-def load_feedback():
+# Load feedback functions
+@st.cache_data(show_spinner=False)
+def _load_feedback_cached(mtime):
+    """
+    Parse the feedback file. The file's mtime is the cache key, so every write
+    to feedback.csv invalidates the cached copy.
+    """
     feedback_file = 'feedback/feedback.csv'
-    if os.path.exists(feedback_file):
+    if mtime is not None and os.path.exists(feedback_file):
         try:
-            # Use quoting=1 (QUOTE_ALL) to properly handle commas in fields
-            return pd.read_csv(feedback_file, quoting=1)
+            # Quoted fields (written with QUOTE_ALL) are handled by both CSV engines.
+            # Feedback is appended, so the last row for an album wins.
+            df = read_csv_snapshot(feedback_file)
+            return df.drop_duplicates(subset=['Album Name', 'Artist'], keep='last')
         except Exception as e:
             st.warning(f"Error loading feedback data: {e}")
             # Try to recover the file
             try:
                 # Attempt to read with different options
-                df = pd.read_csv(feedback_file, quoting=1, error_bad_lines=False) 
+                df = pd.read_csv(feedback_file, quoting=1, on_bad_lines='skip')
                 st.info("Partially recovered feedback data")
-                return df
+                return df.drop_duplicates(subset=['Album Name', 'Artist'], keep='last')
             except:
                 # If all recovery attempts fail, provide an empty DataFrame as fallback
                 st.error("Could not recover feedback data. Starting with fresh feedback file.")
@@ -477,18 +523,39 @@ def load_feedback():
                 return pd.DataFrame(columns=['Album Name', 'Artist', 'Feedback', 'Review'])
     return pd.DataFrame(columns=['Album Name', 'Artist', 'Feedback', 'Review'])
 
-def load_public_feedback():
+def file_mtime(file_path):
+    """Modification time used as a cache key; None if the file doesn't exist."""
+    return os.path.getmtime(file_path) if os.path.exists(file_path) else None
+
+def load_feedback():
+    return _load_feedback_cached(file_mtime('feedback/feedback.csv'))
+
+# The feedback indexes are read by every album card, so they are cache_resource:
+# each card gets the shared dicts instead of unpickling a fresh copy. Read-only.
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _feedback_index(mtime):
+    feedback_df = _load_feedback_cached(mtime)
+    return {(r['Album Name'], r['Artist']): r for r in feedback_df.to_dict('records')}
+
+def feedback_index():
+    """Mike's feedback keyed by (Album Name, Artist)."""
+    return _feedback_index(file_mtime('feedback/feedback.csv'))
+
+def _read_public_feedback(mtime):
+    """
+    Parse the public feedback file (mtime is None when it doesn't exist).
+    """
     feedback_file = 'feedback/public_feedback.csv'
-    if os.path.exists(feedback_file):
+    if mtime is not None and os.path.exists(feedback_file):
         try:
-            # Use quoting=1 (QUOTE_ALL) to properly handle commas in fields
-            return pd.read_csv(feedback_file, quoting=1)
+            # Parse timestamps at load time so callers get datetime64 directly
+            return read_csv_snapshot(feedback_file, parse_dates=['Timestamp'])
         except Exception as e:
             st.warning(f"Error loading public feedback data: {e}")
             # Try to recover the file
             try:
                 # Attempt to read with different options
-                df = pd.read_csv(feedback_file, quoting=1, error_bad_lines=False) 
+                df = pd.read_csv(feedback_file, quoting=1, on_bad_lines='skip')
                 st.info("Partially recovered public feedback data")
                 return df
             except:
@@ -502,303 +569,407 @@ def load_public_feedback():
                         st.info(f"Backed up problematic feedback file to {backup_file}")
                     except:
                         pass
-                return pd.DataFrame(columns=['Album Name', 'Artist', 'Feedback', 'Username', 'Timestamp', 'Review'])
-    return pd.DataFrame(columns=['Album Name', 'Artist', 'Feedback', 'Username', 'Timestamp', 'Review'])
+                return pd.DataFrame(columns=PUBLIC_FEEDBACK_COLUMNS)
+    return pd.DataFrame(columns=PUBLIC_FEEDBACK_COLUMNS)
 
-def get_public_feedback_stats(album_name, artist):
-    """Get statistics for public feedback on a specific album"""
-    public_feedback_df = load_public_feedback()
-    
-    # Filter for this album
-    album_feedback = public_feedback_df[
-        (public_feedback_df['Album Name'] == album_name) & 
-        (public_feedback_df['Artist'] == artist)
-    ]
+# Ids of deleted public reviews. Deleting appends here rather than rewriting
+# public_feedback.csv; "Delete All Reviews" empties both files.
+DELETED_REVIEWS_FILE = 'feedback/deleted_reviews.csv'
+
+def review_ids(df):
+    """
+    Id for each public review: the review_id stored with the row, or for rows saved
+    before ids were stored, one derived from its (parsed) timestamp, username and album.
+    """
+    timestamps = df['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('')
+    derived = (timestamps + '|' + df['Username'].astype(str) + '|'
+               + df['Artist'].astype(str) + '|' + df['Album Name'].astype(str))
+    if 'review_id' not in df.columns:
+        return derived
+    stored = df['review_id'].fillna('').astype(str)
+    return stored.where(stored != '', derived)
+
+@st.cache_data(show_spinner=False)
+def _load_public_feedback_cached(mtimes):
+    """
+    Public feedback minus deleted reviews, with review_id filled in for every row.
+    Keyed on the mtimes of the feedback and deleted-reviews files.
+    """
+    feedback_mtime, deleted_mtime = mtimes
+    df = _read_public_feedback(feedback_mtime)
+    # Parse timestamps here, once, whichever read path produced the frame
+    df = df.assign(Timestamp=pd.to_datetime(df['Timestamp'], errors='coerce'))
+    df = df.assign(review_id=review_ids(df))
+    if deleted_mtime is not None:
+        df = df[~df['review_id'].isin(deleted_review_ids())]
+    return df
+
+def deleted_review_ids():
+    """The review_ids listed in DELETED_REVIEWS_FILE (empty if there is none)."""
+    if not os.path.exists(DELETED_REVIEWS_FILE):
+        return set()
+    with open(DELETED_REVIEWS_FILE, newline='', encoding='utf-8') as f:
+        return {row[0] for row in csv.reader(f) if row}
+
+def public_feedback_mtimes():
+    return file_mtime('feedback/public_feedback.csv'), file_mtime(DELETED_REVIEWS_FILE)
+
+def load_public_feedback():
+    return _load_public_feedback_cached(public_feedback_mtimes())
+
+def refresh_public_feedback():
+    """
+    Drop the cached public feedback and its per-album index after a write.
+    Other cached data (predictions, covers, Mike's feedback) is left alone.
+    """
+    _load_public_feedback_cached.clear()
+    _public_feedback_index.clear()
+
+def delete_public_reviews(ids):
+    """
+    Delete public reviews by appending their review_ids to DELETED_REVIEWS_FILE.
+    Each id is written once, however many times the selection repeats it.
+    """
+    append_csv_rows(DELETED_REVIEWS_FILE, ['review_id'], [[review_id] for review_id in dict.fromkeys(ids)])
+    refresh_public_feedback()
+
+def compact_public_feedback():
+    """
+    Apply the pending deletes in DELETED_REVIEWS_FILE to public_feedback.csv with a
+    single rewrite, then drop the ids file.
+    """
+    feedback_file = 'feedback/public_feedback.csv'
+    if os.path.exists(feedback_file):
+        df = load_public_feedback()
+        # Rewrite from the file's own text rather than the parsed frame, so a value the
+        # loader couldn't parse (a malformed Timestamp becomes NaT) is kept as written
+        raw = pd.read_csv(feedback_file, dtype=str, keep_default_na=False)
+        ids = review_ids(raw.assign(Timestamp=pd.to_datetime(raw['Timestamp'], errors='coerce')))
+        write_csv_frame(feedback_file, raw.assign(review_id=ids)[~ids.isin(deleted_review_ids())])
+        # When every timestamp parsed, the loaded frame is what the next read would
+        # produce, so store it as the snapshot instead of re-parsing the rewritten CSV
+        if df['Timestamp'].notna().all():
+            try:
+                write_snapshot(feedback_file, df)
+            except Exception as e:
+                print(f"Could not write snapshot for {feedback_file}: {e}")
+    if os.path.exists(DELETED_REVIEWS_FILE):
+        os.remove(DELETED_REVIEWS_FILE)
+    refresh_public_feedback()
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _public_feedback_index(mtimes, limit=3):
+    """
+    Group public feedback once by (Album Name, Artist). Keyed on the files' mtimes.
+    Returns a dict of rating counts, and a dict of (recent ratings line, recent review lines)
+    per album, formatted here so the album cards only render them.
+    """
+    public_feedback_df = _load_public_feedback_cached(mtimes)
+    if public_feedback_df.empty:
+        return {}, {}
     
-    if album_feedback.empty:
-        return {"like": 0, "mid": 0, "dislike": 0, "total": 0}
+    keys = ['Album Name', 'Artist']
+    grouped = public_feedback_df.groupby(keys)
     
-    # Count each feedback type
-    feedback_counts = album_feedback['Feedback'].value_counts().to_dict()
+    # Count each feedback type in one pass, ensuring all categories exist
+    stats = (grouped['Feedback'].value_counts().unstack(fill_value=0)
+             .reindex(columns=['like', 'mid', 'dislike'], fill_value=0))
+    stats['total'] = grouped.size()
+    stats_by_key = stats.astype(int).to_dict('index')
     
-    # Ensure all categories exist
-    stats = {
-        "like": feedback_counts.get('like', 0),
-        "mid": feedback_counts.get('mid', 0),
-        "dislike": feedback_counts.get('dislike', 0),
-        "total": len(album_feedback)
-    }
+    # Sort everything by timestamp (newest first) once, then take the top 'limit' per album
+    recent = (public_feedback_df.sort_values('Timestamp', ascending=False)
+              .groupby(keys).head(limit))
+    has_reviews = 'Review' in recent.columns
+    recent_by_key = {}
+    for key, album_feedback in recent.groupby(keys, sort=False):
+        records = album_feedback.to_dict('records')
+        ratings = ' • '.join(f"{fb['Username']} {rating_emoji(fb['Feedback'])}" for fb in records)
+        reviews = [
+            f'{fb["Username"]} {rating_emoji(fb["Feedback"])}: "{fb["Review"]}"'
+            for fb in records if has_reviews and not pd.isna(fb['Review']) and fb['Review'] != ""
+        ]
+        recent_by_key[key] = (ratings, reviews)
     
-    return stats
+    return stats_by_key, recent_by_key
 
-def get_recent_public_feedback(album_name, artist, limit=3):
-    """Get the most recent public feedback for a specific album"""
-    public_feedback_df = load_public_feedback()
-    
-    # Filter for this album
-    album_feedback = public_feedback_df[
-        (public_feedback_df['Album Name'] == album_name) & 
-        (public_feedback_df['Artist'] == artist)
-    ]
-    
-    if album_feedback.empty:
-        return pd.DataFrame(columns=['Album Name', 'Artist', 'Feedback', 'Username', 'Timestamp', 'Review'])
+def get_public_feedback_index(limit=3):
+    return _public_feedback_index(public_feedback_mtimes(), limit)
+
+def prefetch_data(loaders, max_workers=4):
+    """
+    Run independent (name, loader) pairs concurrently so their file reads and CSV parsing
+    overlap. Each loader fills its own cache; returns a dict of results by name.
+    """
+    ctx = get_script_run_ctx()
     
-    # Sort by timestamp (newest first) and take the top 'limit' entries
-    album_feedback['Timestamp'] = pd.to_datetime(album_feedback['Timestamp'])
-    recent_feedback = album_feedback.sort_values('Timestamp', ascending=False).head(limit)
+    def run(loader):
+        # Let cached loaders (and any warnings they emit) see this session
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return loader()
     
-    return recent_feedback
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(run, loader) for name, loader in loaders}
+        return {name: future.result() for name, future in futures.items()}
+
+# Album card HTML, built once at import instead of per album
+ALBUM_ART_PLACEHOLDER_HTML = """
+<div style="display: flex; justify-content: center; align-items: center; 
+          height: 300px; background-color: #f0f0f0; border-radius: 10px;">
+    <span style="font-size: 48px;">🎵</span>
+</div>
+"""
+ALBUM_TITLE_TMPL = '<div class="album-title" style="font-size: 1.8rem; font-weight: 600; margin-bottom: 16px;">{0} - {1}</div>'
+FIELD_TMPL = '<div class="large-text" style="font-size: 1.2rem; line-height: 1.6; margin: 8px 0;"><strong>{0}:</strong> {1}</div>'
+
+# Rating buttons shown on each album card, in display order
+RATINGS = [('like', '👍 Like'), ('mid', '😐 Mid'), ('dislike', '👎 Dislike')]
+RATING_EMOJI = {'like': '👍', 'mid': '😐', 'dislike': '👎'}
+
+def rating_emoji(feedback):
+    """Emoji for a rating; anything other than like/mid shows as a dislike."""
+    return RATING_EMOJI.get(feedback, RATING_EMOJI['dislike'])
+
+MIKE_VERDICTS = {
+    'like': '👍 Mike liked it',
+    'mid': '😐 Mike thought it was mid',
+    'dislike': '👎 Mike didn\'t like it',
+}
+
+def handle_rating(rating, album_name, artist, username, review, existing_review):
+    """
+    Save a rating from an album card. Mike's ratings go to his own feedback file and keep
+    his existing review unless a new one was written; everyone else's are public feedback.
+    """
+    if username == "Mike S":
+        save_feedback(album_name, artist, rating, review or existing_review)
+    else:
+        save_public_feedback(album_name, artist, rating, username, review)
 
-# The display_album_predictions function
-def display_album_predictions(filtered_data, album_covers_df, similar_artists_df):
+# st.fragment (st.experimental_fragment before Streamlit 1.37) reruns only the decorated
+# function when one of its widgets is used. Older versions simply run the card inline;
+# that includes the streamlit==1.31.1 pinned in requirements.txt, where this is a no-op
+# until the pin is raised to 1.37+ (needed for st.rerun(scope="fragment") as well).
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+def rerun_card():
+    """
+    Rerun just the current album card where Streamlit supports fragment-scoped reruns,
+    otherwise rerun the whole app.
+    """
     try:
-        album_links_df = load_album_links()
-    except Exception as e:
-        st.error(f"Error loading album links: {e}")
-        album_links_df = pd.DataFrame()
+        st.rerun(scope="fragment")
+    except TypeError:
+        st.rerun()
+
+NO_PUBLIC_STATS = {"like": 0, "mid": 0, "dislike": 0, "total": 0}
+
+@fragment
+def album_card(album):
+    """
+    Render one album card. Feedback is looked up here rather than passed in, so a
+    fragment rerun after a rating click shows the freshly saved data.
+    """
+    artist = album['Artist']
+    album_name = album['Album Name']
+    feedback_by_key = feedback_index()
+    public_stats_by_key, recent_public_by_key = get_public_feedback_index(3)
     
-    try:
-        merged_data = filtered_data.merge(
-            album_covers_df[['Artist', 'Album Name', 'Album Art']], 
-            on=['Artist', 'Album Name'],
-            how='left'
-        )
+    with st.container():
+        st.markdown('<div class="album-container">', unsafe_allow_html=True)
+        cols = st.columns([2, 4, 1, 1])
         
-        if not album_links_df.empty:
-            merged_data = merged_data.merge(
-                album_links_df[['Album Name', 'Artist Name(s)', 'Spotify URL']],
-                left_on=['Album Name', 'Artist'],
-                right_on=['Album Name', 'Artist Name(s)'],
-                how='left'
-            )
-    except Exception as e:
-        st.error(f"Error merging data: {e}")
-        merged_data = filtered_data
-    
-    filtered_albums = merged_data
-    
-    for idx, row in filtered_albums.iterrows():
-        with st.container():
-            st.markdown('<div class="album-container">', unsafe_allow_html=True)
-            cols = st.columns([2, 4, 1, 1])
+        with cols[0]:
+            if album['Album Art'] is not None:
+                st.image(album['Album Art'], width=300, use_column_width="always")
+            else:
+                st.markdown(ALBUM_ART_PLACEHOLDER_HTML, unsafe_allow_html=True)
+        
+        with cols[1]:
+            # Title and detail fields go out as a single markdown element
+            details = [
+                ALBUM_TITLE_TMPL.format(artist, album_name),
+                FIELD_TMPL.format('Genre', album['Genres']),
+                FIELD_TMPL.format('Label', album['Label'])
+            ]
             
-            with cols[0]:
-                if 'Album Art' in row and pd.notna(row['Album Art']):
-                    st.image(row['Album Art'], width=300, use_column_width="always")
-                else:
-                    st.markdown(
-                        """
-                        <div style="display: flex; justify-content: center; align-items: center; 
-                                  height: 300px; background-color: #f0f0f0; border-radius: 10px;">
-                            <span style="font-size: 48px;">🎵</span>
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
+            if album['Similar Artists'] is not None:
+                details.append(FIELD_TMPL.format('Similar Artists', album['Similar Artists']))
+            st.markdown(''.join(details), unsafe_allow_html=True)
             
-            with cols[1]:
-                st.markdown(f'<div class="album-title" style="font-size: 1.8rem; font-weight: 600; margin-bottom: 16px;">{row["Artist"]} - {row["Album Name"]}</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="large-text" style="font-size: 1.2rem; line-height: 1.6; margin: 8px 0;"><strong>Genre:</strong> {row["Genres"]}</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="large-text" style="font-size: 1.2rem; line-height: 1.6; margin: 8px 0;"><strong>Label:</strong> {row["Label"]}</div>', unsafe_allow_html=True)
-                
-                similar_artists = similar_artists_df[
-                    similar_artists_df['Artist'] == row['Artist']
-                ]
-                
-                if not similar_artists.empty:
-                    similar_list = similar_artists.iloc[0]['Similar Artists']
-                    st.markdown(f'<div class="large-text" style="font-size: 1.2rem; line-height: 1.6; margin: 8px 0;"><strong>Similar Artists:</strong> {similar_list}</div>', unsafe_allow_html=True)
-                
-                if 'Spotify URL' in row and pd.notna(row['Spotify URL']):
-                    spotify_url = row['Spotify URL']
-                    st.markdown(f'''
-                        <a href="https://{spotify_url}" target="_blank" class="spotify-button">
-                            ▶ Play on Spotify
-                        </a>
-                    ''', unsafe_allow_html=True) 
-                
-                # Public rating section with username input
-                st.markdown('<div class="feedback-container">', unsafe_allow_html=True)
-                st.markdown('<div style="font-weight: 600; margin-bottom: 8px;">Mike wants to know what you think!</div>', unsafe_allow_html=True)
-
-                # Username input
-                username = st.text_input("Your name (optional):", key=f"username_input_{idx}", value="")
-                username = username.strip() if username else "Anonymous"
-
-                # Load existing feedback to pre-populate the review field
-                feedback_df = load_feedback()
-                existing_feedback = feedback_df[
-                    (feedback_df['Album Name'] == row['Album Name']) & 
-                    (feedback_df['Artist'] == row['Artist'])
-                ]
-                
-                # Create a unique key using album name and artist
-                unique_key = f"{row['Album Name']}_{row['Artist']}"
-
-                # Pre-populate the review field if feedback exists
-                # But set value to empty string to prevent persistence
-                existing_review = ""
-                if not existing_feedback.empty:
-                    existing_review = existing_feedback.iloc[0].get('Review', '')
-                    # We still load it to display elsewhere, but don't use it in the text area
-
-                # Add review input field with empty value to prevent persistence
-                review = st.text_area("Mini review (optional):", 
-                                     value="", 
-                                     key=f"review_input_{unique_key}", 
-                                     max_chars=200, 
-                                     height=80)
-
-
-                # Create fixed-width columns for buttons
-                button_cols = st.columns(3)
-
-                # Create a unique key using album name and artist
-                unique_key = f"{row['Album Name']}_{row['Artist']}"
-
-                # Like Button
-                with button_cols[0]:
-                    if st.button('👍 Like', key=f"public_like_{unique_key}", use_container_width=True):
-                        if username == "Mike S":
-                            # Load existing feedback to check if a review already exists
-                            feedback_df = load_feedback()
-                            existing_feedback = feedback_df[
-                                (feedback_df['Album Name'] == row['Album Name']) & 
-                                (feedback_df['Artist'] == row['Artist'])
-                            ]
-                            
-                            # Preserve existing review if it exists
-                            existing_review = ""
-                            if not existing_feedback.empty:
-                                existing_review = existing_feedback.iloc[0].get('Review', '')
-                            
-                            # Save feedback with the new review (if provided) or the existing review
-                            save_feedback(row['Album Name'], row['Artist'], 'like', review or existing_review)
-                            # Display as just "Mike"
-                            username = "Mike"
-                        else:
-                            save_public_feedback(row['Album Name'], row['Artist'], 'like', username, review)
-                        
-                        # Just rerun - the review will be cleared because we set value=""
-                        st.rerun()
-
-                # Mid Button
-                with button_cols[1]:
-                    if st.button('😐 Mid', key=f"public_mid_{unique_key}", use_container_width=True):
-                        if username == "Mike S":
-                            # Load existing feedback to check if a review already exists
-                            feedback_df = load_feedback()
-                            existing_feedback = feedback_df[
-                                (feedback_df['Album Name'] == row['Album Name']) & 
-                                (feedback_df['Artist'] == row['Artist'])
-                            ]
-                            
-                            # Preserve existing review if it exists
-                            existing_review = ""
-                            if not existing_feedback.empty:
-                                existing_review = existing_feedback.iloc[0].get('Review', '')
-                            
-                            # Save feedback with the new review (if provided) or the existing review
-                            save_feedback(row['Album Name'], row['Artist'], 'mid', review or existing_review)
-                            # Display as just "Mike"
-                            username = "Mike"
-                        else:
-                            save_public_feedback(row['Album Name'], row['Artist'], 'mid', username, review)
-                        
-                        # Just rerun - the review will be cleared because we set value=""
-                        st.rerun()
-
-                # Dislike Button
-                with button_cols[2]:
-                    if st.button('👎 Dislike', key=f"public_dislike_{unique_key}", use_container_width=True):
-                        if username == "Mike S":
-                            # Load existing feedback to check if a review already exists
-                            feedback_df = load_feedback()
-                            existing_feedback = feedback_df[
-                                (feedback_df['Album Name'] == row['Album Name']) & 
-                                (feedback_df['Artist'] == row['Artist'])
-                            ]
-                            
-                            # Preserve existing review if it exists
-                            existing_review = ""
-                            if not existing_feedback.empty:
-                                existing_review = existing_feedback.iloc[0].get('Review', '')
-                            
-                            # Save feedback with the new review (if provided) or the existing review
-                            save_feedback(row['Album Name'], row['Artist'], 'dislike', review or existing_review)
-                            # Display as just "Mike"
-                            username = "Mike"
-                        else:
-                            save_public_feedback(row['Album Name'], row['Artist'], 'dislike', username, review)
+            spotify_url = album['Spotify URL']
+            if spotify_url is not None:
+                st.markdown(f'''
+                    <a href="https://{spotify_url}" target="_blank" class="spotify-button">
+                        ▶ Play on Spotify
+                    </a>
+                ''', unsafe_allow_html=True) 
+            
+            # Public rating section with username input
+            st.markdown('<div class="feedback-container">', unsafe_allow_html=True)
+            st.markdown('<div style="font-weight: 600; margin-bottom: 8px;">Mike wants to know what you think!</div>', unsafe_allow_html=True)
+
+            # Create a unique key using album name and artist
+            unique_key = f"{album_name}_{artist}"
+
+            # Username input, keyed on the album so typed text stays with it when the list is filtered
+            username = st.text_input("Your name (optional):", key=f"username_input_{unique_key}", value="")
+            username = username.strip() if username else "Anonymous"
+
+            # Look up existing feedback to pre-populate the review field
+            existing_feedback = feedback_by_key.get((album_name, artist))
+
+            # Pre-populate the review field if feedback exists
+            # But set value to empty string to prevent persistence
+            existing_review = ""
+            if existing_feedback is not None:
+                existing_review = existing_feedback.get('Review', '')
+                # We still load it to display elsewhere, but don't use it in the text area
+
+            # Add review input field with empty value to prevent persistence
+            review = st.text_area("Mini review (optional):", 
+                                 value="", 
+                                 key=f"review_input_{unique_key}", 
+                                 max_chars=200, 
+                                 height=80)
+
+
+            # Create fixed-width columns for buttons
+            button_cols = st.columns(len(RATINGS))
+
+            for i, (rating, label) in enumerate(RATINGS):
+                with button_cols[i]:
+                    if st.button(label, key=f"public_{rating}_{unique_key}", use_container_width=True):
+                        handle_rating(rating, album_name, artist, username, review, existing_review)
                         
-                        # Just rerun - the review will be cleared because we set value=""
-                        st.rerun()
+                        # Just rerun this card - the review will be cleared because we set value=""
+                        rerun_card()
 
-
-
-                st.markdown('</div>', unsafe_allow_html=True)  # Close the feedback-container div
+            st.markdown('</div>', unsafe_allow_html=True)  # Close the feedback-container div
+            
+            # Display public rating stats
+            public_stats = public_stats_by_key.get((album_name, artist), NO_PUBLIC_STATS)
+            if public_stats['total'] > 0:
+                recent_ratings, recent_reviews = recent_public_by_key[(album_name, artist)]
+                if recent_ratings:
+                    st.markdown(f'<div class="public-rating-stats">{recent_ratings}</div>', unsafe_allow_html=True)
                 
-                # Display public rating stats
-                public_stats = get_public_feedback_stats(row['Album Name'], row['Artist'])
-                if public_stats['total'] > 0:
-                    recent_feedback = get_recent_public_feedback(row['Album Name'], row['Artist'], 3)
-                    feedback_display = ""
-                    for _, fb in recent_feedback.iterrows():
-                        emoji = "👍" if fb['Feedback'] == 'like' else "😐" if fb['Feedback'] == 'mid' else "👎"
-                        feedback_display += f"{fb['Username']} {emoji} • "
-                    
-                    if feedback_display:
-                        feedback_display = feedback_display[:-3]  # Remove trailing " • "
-                        st.markdown(f'<div class="public-rating-stats">{feedback_display}</div>', unsafe_allow_html=True)
-                    
-                    st.markdown(f'<div class="public-rating-stats">Total: {public_stats["like"]} 👍 | {public_stats["mid"]} 😐 | {public_stats["dislike"]} 👎</div>', unsafe_allow_html=True)
-                    
-                    # Display recent reviews
-                    if 'Review' in recent_feedback.columns:  # Check if the 'Review' column exists
-                        reviews_to_show = recent_feedback[recent_feedback['Review'].notna() & (recent_feedback['Review'] != "")]
-                        if not reviews_to_show.empty:
-                            st.markdown('<div class="recent-reviews" style="margin-top: 10px;">', unsafe_allow_html=True)
-                            for _, fb in reviews_to_show.iterrows():
-                                emoji = "👍" if fb['Feedback'] == 'like' else "😐" if fb['Feedback'] == 'mid' else "👎"
-                                st.markdown(f'<div style="font-style: italic; margin-bottom: 5px;">{fb["Username"]} {emoji}: "{fb["Review"]}"</div>', unsafe_allow_html=True)
-                            st.markdown('</div>', unsafe_allow_html=True)
-                else:
-                    st.markdown('<div class="public-rating-stats">No ratings yet - be the first!</div>', unsafe_allow_html=True)
+                st.markdown(f'<div class="public-rating-stats">Total: {public_stats["like"]} 👍 | {public_stats["mid"]} 😐 | {public_stats["dislike"]} 👎</div>', unsafe_allow_html=True)
                 
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            with cols[2]:
-                st.markdown('<div class="metric-container">', unsafe_allow_html=True)
-                st.metric("Predicted Score", f"{row['avg_score']:.1f}")
-                st.markdown('</div>', unsafe_allow_html=True)
+                # Display recent reviews
+                if recent_reviews:
+                    st.markdown('<div class="recent-reviews" style="margin-top: 10px;">', unsafe_allow_html=True)
+                    for review_line in recent_reviews:
+                        st.markdown(f'<div style="font-style: italic; margin-bottom: 5px;">{review_line}</div>', unsafe_allow_html=True)
+                    st.markdown('</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="public-rating-stats">No ratings yet - be the first!</div>', unsafe_allow_html=True)
             
-            # Feedback section
-            with cols[3]:
-                feedback_df = load_feedback()
-                existing_feedback = feedback_df[
-                    (feedback_df['Album Name'] == row['Album Name']) & 
-                    (feedback_df['Artist'] == row['Artist'])
-                ]
+            st.markdown('</div>', unsafe_allow_html=True)
+        
+        with cols[2]:
+            st.markdown('<div class="metric-container">', unsafe_allow_html=True)
+            st.metric("Predicted Score", f"{album['avg_score']:.1f}")
+            st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Feedback section
+        with cols[3]:
+            if existing_feedback is not None:
+                feedback = existing_feedback['Feedback']
+                review_text = existing_feedback.get('Review', '')
                 
-                if not existing_feedback.empty:
-                    feedback = existing_feedback.iloc[0]['Feedback']
-                    review_text = existing_feedback.iloc[0].get('Review', '')
-                    
-                    if feedback == 'like':
-                        st.markdown('👍 Mike liked it')
-                    elif feedback == 'mid':
-                        st.markdown('😐 Mike thought it was mid')
-                    elif feedback == 'dislike':
-                        st.markdown('👎 Mike didn\'t like it')
-                    
-                    # Display Mike's review if it exists
-                    if review_text and not pd.isna(review_text):
-                        st.markdown(f'<div style="font-style: italic; margin-top: 5px;">"{review_text}"</div>', unsafe_allow_html=True)
-                else:
-                    st.markdown('😶 Mike hasn\'t listened/rated this album.')
+                if feedback in MIKE_VERDICTS:
+                    st.markdown(MIKE_VERDICTS[feedback])
                 
-            st.markdown('</div>', unsafe_allow_html=True)
+                # Display Mike's review if it exists
+                if review_text and not pd.isna(review_text):
+                    st.markdown(f'<div style="font-style: italic; margin-top: 5px;">"{review_text}"</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('😶 Mike hasn\'t listened/rated this album.')
+            
+        st.markdown('</div>', unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def genre_sets(file_path=None, analysis_date=None):
+    """
+    Each album's genres as a frozenset, aligned with load_predictions()'s index,
+    so genre filtering is a set intersection per album instead of substring scans.
+    """
+    predictions_data = load_predictions(file_path, analysis_date)
+    if predictions_data is None:
+        return pd.Series(dtype=object)
+    df, _ = predictions_data
+    return df['Genres'].fillna('').str.split(',').map(
+        lambda genres: frozenset(g.strip() for g in genres if g.strip())
+    )
+
+@st.cache_data(show_spinner=False)
+def filter_genre_options(genres):
+    """
+    Drop genres that contain numbers or have more than 2 words (hyphenated words count
+    separately) from a sorted tuple of genres, so the filter only offers broad genres.
+    """
+    genres = pd.Series(genres, dtype=object)
+    word_counts = genres.str.replace('-', ' ', regex=False).str.split().str.len()
+    keep = ~genres.str.contains(r'\d', regex=True) & (word_counts <= 2)
+    return genres[keep].tolist()
+
+# The display_album_predictions function
+def display_album_predictions(filtered_albums):
+    # Build lookups once per render instead of merging/filtering DataFrames per album
+    cover_by_key = album_cover_map()
+    link_by_key = album_link_map()
+    sim_by_artist = similar_artist_map()
+    
+    # Plain tuples avoid building a Series per album
+    col_ix = {c: i for i, c in enumerate(filtered_albums.columns)}
+    for t in filtered_albums.itertuples(index=False, name=None):
+        artist = t[col_ix['Artist']]
+        album_name = t[col_ix['Album Name']]
+        
+        album_art = cover_by_key.get((artist, album_name))
+        spotify_url = link_by_key.get((album_name, artist))
+        album_card({
+            'Artist': artist,
+            'Album Name': album_name,
+            'Genres': t[col_ix['Genres']],
+            'Label': t[col_ix['Label']],
+            'avg_score': t[col_ix['avg_score']],
+            # Missing/NaN values become None
+            'Album Art': album_art if album_art is not None and album_art == album_art else None,
+            'Spotify URL': spotify_url if spotify_url is not None and spotify_url == spotify_url else None,
+            'Similar Artists': sim_by_artist.get(artist)
+        })
+
+# Rows per page in the album fixer lists; each row renders its own widgets
+ADMIN_PAGE_SIZE = 20
+
+def paginate(df, key, page_size=ADMIN_PAGE_SIZE):
+    """
+    Render a page selector and return only the selected page of df. The page is kept in
+    st.session_state under `key`, so it survives switching tabs.
+    """
+    pages = max(1, math.ceil(len(df) / page_size))
+    if pages == 1:
+        return df
+    # The list may have shrunk (search, saves, deletes) since the page was chosen
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+def quick_search_buttons(key_prefix):
+    """
+    Render a row of QUICK_SEARCH_TERMS buttons; returns the clicked term, or None.
+    """
+    st.write("Quick searches:")
+    clicked = None
+    for col, term in zip(st.columns(len(QUICK_SEARCH_TERMS)), QUICK_SEARCH_TERMS):
+        with col:
+            if st.button(term, key=f"{key_prefix}{term}"):
+                clicked = term
+    return clicked
 
 def about_me_page():
     st.title("# About Me")
@@ -834,26 +1005,20 @@ def album_fixer_page():
     with tab1:
         st.subheader("Manage Missing Album Artwork")
         
-        # Load the current album covers data and predictions data
-        album_covers_df = load_album_covers()
-        predictions_data = load_predictions()
+        # Load the albums in the current predictions
+        all_albums_df = unique_albums()
         
-        if predictions_data is None:
+        if all_albums_df is None:
             st.error("Could not load prediction data. Please check the predictions folder.")
             return
         
-        df, _ = predictions_data
-        all_albums_df = df[['Artist', 'Album Name']].drop_duplicates()
+        # Identify albums missing artwork (dict lookups instead of a merge)
+        covers = album_cover_map()
+        merged_df = all_albums_df.assign(**{'Album Art': [
+            covers.get(key) for key in zip(all_albums_df['Artist'], all_albums_df['Album Name'])
+        ]})
         
-        # Identify albums missing artwork
-        merged_df = all_albums_df.merge(
-            album_covers_df,
-            left_on=['Artist', 'Album Name'],
-            right_on=['Artist', 'Album Name'],
-            how='left'
-        )
-        
-        missing_artwork = merged_df[merged_df['Album Art'].isna()].copy()
+        missing_artwork = merged_df[merged_df['Album Art'].isna()]
         
         # Show statistics
         col1, col2 = st.columns(2)
@@ -870,84 +1035,81 @@ def album_fixer_page():
             search_query = st.text_input("Search by artist or album name:", key="artwork_search")
             
             # Quick search buttons
-            quick_search_terms = ['Live', 'Deluxe', 'Reissue']
-            st.write("Quick searches:")
-            cols = st.columns(len(quick_search_terms))
-            for i, term in enumerate(quick_search_terms):
-                with cols[i]:
-                    if st.button(term, key=f"quick_search_{term}"):
-                        search_query = term
+            search_query = quick_search_buttons("quick_search_") or search_query
             
             # Filter albums based on search
             if search_query:
                 filtered_missing = missing_artwork[
-                    missing_artwork['Artist'].str.contains(search_query, case=False) |
-                    missing_artwork['Album Name'].str.contains(search_query, case=False)
+                    missing_artwork['_artist_lc'].str.contains(search_query.lower(), regex=False, na=False) |
+                    missing_artwork['_album_lc'].str.contains(search_query.lower(), regex=False, na=False)
                 ]
             else:
                 filtered_missing = missing_artwork
             
             # Display filtered results
             st.subheader(f"Albums Missing Artwork ({len(filtered_missing)})")
+            page_missing = paginate(filtered_missing, "artwork_page")
             
-            for _, row in filtered_missing.iterrows():
-                with st.container():
-                    st.markdown("---")
+            for artist, album in page_missing[['Artist', 'Album Name']].itertuples(index=False, name=None):
+                st.markdown("---")
+                # A form per row: typing a URL doesn't rerun the page, only Preview/Save do
+                with st.form(key=f"artwork_form_{artist}_{album}"):
                     cols = st.columns([2, 3, 1])
                     
                     with cols[0]:
-                        st.write(f"**Artist:** {row['Artist']}")
-                        st.write(f"**Album:** {row['Album Name']}")
+                        st.write(f"**Artist:** {artist}")
+                        st.write(f"**Album:** {album}")
                     
                     with cols[1]:
                         url = st.text_input(
                             "Image URL:",
-                            key=f"url_{row['Artist']}_{row['Album Name']}"
+                            key=f"url_{artist}_{album}"
                         )
                         st.caption("Right-click image in Google and copy image address")
                     
                     with cols[2]:
-                        if url:
-                            try:
-                                st.image(url, width=100)
-                                if st.button("Save", key=f"save_{row['Artist']}_{row['Album Name']}"):
-                                    # Add new row to album_covers_df
-                                    new_row = {
-                                        'Artist': row['Artist'],
-                                        'Album Name': row['Album Name'],
-                                        'Album Art': url
-                                    }
-                                    album_covers_df = pd.concat([album_covers_df, pd.DataFrame([new_row])], ignore_index=True)
-                                    album_covers_df.to_csv('data/nmf_album_covers.csv', index=False)
-                                    st.success("Saved!")
-                                    st.cache_data.clear()
-                                    st.rerun()
-                            except:
+                        preview = st.form_submit_button("Preview")
+                        save = st.form_submit_button("Save")
+                        if url and (preview or save):
+                            if url.startswith(('http://', 'https://')):
+                                # Let the browser fetch the thumbnail lazily instead of st.image
+                                st.markdown(f'<img loading="lazy" src="{html.escape(url)}" width="100">', unsafe_allow_html=True)
+                            else:
                                 st.error("Invalid image URL")
+                                save = False
+                
+                if url and save:
+                    # Append the new cover to the covers file
+                    new_row = {
+                        'Artist': artist,
+                        'Album Name': album,
+                        'Album Art': url
+                    }
+                    append_csv_record('data/nmf_album_covers.csv', new_row)
+                    st.success("Saved!")
+                    load_album_covers.clear()
+                    album_cover_map.clear()
+                    album_cover_rows.clear()
+                    st.rerun()
 
     with tab2:
         st.subheader("Fix Album Covers with Wrong Image")
         
         # Load the current album covers data and predictions data
         album_covers_df = load_album_covers()
-        predictions_data = load_predictions()
+        all_albums_df = unique_albums()
         
-        if predictions_data is None:
+        if all_albums_df is None:
             st.error("Could not load prediction data. Please check the predictions folder.")
             return
         
-        df, _ = predictions_data
-        all_albums_df = df[['Artist', 'Album Name']].drop_duplicates()
+        # Look up covers for all albums and keep the ones that have one
+        covers = album_cover_map()
+        merged_df = all_albums_df.assign(**{'Album Art': [
+            covers.get(key) for key in zip(all_albums_df['Artist'], all_albums_df['Album Name'])
+        ]})
         
-        # Merge with album covers to get all albums with covers
-        merged_df = all_albums_df.merge(
-            album_covers_df,
-            left_on=['Artist', 'Album Name'],
-            right_on=['Artist', 'Album Name'],
-            how='inner'
-        )
-        
-        albums_with_covers = merged_df.copy()
+        albums_with_covers = merged_df[merged_df['Album Art'].notna()]
         
         # Show statistics
         col1, col2 = st.columns(2)
@@ -1004,16 +1166,18 @@ def album_fixer_page():
                 # Save the new URL
                 if new_url and st.button("Update Album Cover", key="update_artwork"):
                     # Update the existing entry
-                    album_covers_df.loc[(album_covers_df['Artist'] == artist) & 
-                                      (album_covers_df['Album Name'] == album), 'Album Art'] = new_url
+                    rows = album_cover_rows().get((artist, album), [])
+                    album_covers_df.iloc[rows, album_covers_df.columns.get_loc('Album Art')] = new_url
                     
                     # Save the updated dataframe
                     try:
-                        album_covers_df.to_csv('data/nmf_album_covers.csv', index=False)
+                        write_csv_frame('data/nmf_album_covers.csv', album_covers_df, quoting=csv.QUOTE_MINIMAL)
                         st.success(f"Updated album art URL for {artist} - {album}")
                         
                         # Clear cache to reflect the update
-                        st.cache_data.clear()
+                        load_album_covers.clear()
+                        album_cover_map.clear()
+                        album_cover_rows.clear()
                         st.rerun()
                     except Exception as e:
                         st.error(f"Failed to save: {e}")
@@ -1023,27 +1187,22 @@ def album_fixer_page():
         
         # Load the current album links data and predictions data
         album_links_df = load_album_links()
-        predictions_data = load_predictions()
+        all_albums_df = unique_albums()
         
-        if predictions_data is None:
+        if all_albums_df is None:
             st.error("Could not load prediction data. Please check the predictions folder.")
             return
         
-        df, _ = predictions_data
-        all_albums_df = df[['Artist', 'Album Name']].drop_duplicates()
-        
         # Rename Artist column to match album_links_df
         all_albums_df = all_albums_df.rename(columns={'Artist': 'Artist Name(s)'})
         
-        # Identify albums missing Spotify links
-        merged_df = all_albums_df.merge(
-            album_links_df,
-            left_on=['Album Name', 'Artist Name(s)'],
-            right_on=['Album Name', 'Artist Name(s)'],
-            how='left'
-        )
+        # Identify albums missing Spotify links (dict lookups instead of a merge)
+        links = album_link_map()
+        merged_df = all_albums_df.assign(**{'Spotify URL': [
+            links.get(key) for key in zip(all_albums_df['Album Name'], all_albums_df['Artist Name(s)'])
+        ]})
         
-        missing_links = merged_df[merged_df['Spotify URL'].isna()].copy()
+        missing_links = merged_df[merged_df['Spotify URL'].isna()]
         
         # Show statistics
         col1, col2 = st.columns(2)
@@ -1060,144 +1219,129 @@ def album_fixer_page():
             search_query = st.text_input("Search by artist or album name:", key="spotify_search")
             
             # Quick search buttons
-            quick_search_terms = ['Live', 'Deluxe', 'Reissue']
-            st.write("Quick searches:")
-            cols = st.columns(len(quick_search_terms))
-            for i, term in enumerate(quick_search_terms):
-                with cols[i]:
-                    if st.button(term, key=f"spotify_quick_search_{term}"):
-                        search_query = term
+            search_query = quick_search_buttons("spotify_quick_search_") or search_query
             
             # Filter albums based on search
             if search_query:
                 filtered_missing = missing_links[
-                    missing_links['Artist Name(s)'].str.contains(search_query, case=False) |
-                    missing_links['Album Name'].str.contains(search_query, case=False)
+                    missing_links['_artist_lc'].str.contains(search_query.lower(), regex=False, na=False) |
+                    missing_links['_album_lc'].str.contains(search_query.lower(), regex=False, na=False)
                 ]
             else:
                 filtered_missing = missing_links
             
             # Display filtered results
             st.subheader(f"Albums Missing Spotify Links ({len(filtered_missing)})")
+            page_missing = paginate(filtered_missing, "spotify_page")
             
-            for _, row in filtered_missing.iterrows():
-                with st.container():
-                    st.markdown("---")
+            for artist, album in page_missing[['Artist Name(s)', 'Album Name']].itertuples(index=False, name=None):
+                st.markdown("---")
+                # A form per row: typing a URL doesn't rerun the page, only Save does
+                with st.form(key=f"spotify_form_{artist}_{album}"):
                     cols = st.columns([2, 3, 1])
                     
                     with cols[0]:
-                        st.write(f"**Artist:** {row['Artist Name(s)']}")
-                        st.write(f"**Album:** {row['Album Name']}")
+                        st.write(f"**Artist:** {artist}")
+                        st.write(f"**Album:** {album}")
                     
                     with cols[1]:
                         url = st.text_input(
                             "Spotify URL:",
-                            key=f"spotify_url_{row['Artist Name(s)']}_{row['Album Name']}",
+                            key=f"spotify_url_{artist}_{album}",
                             help="Paste full Spotify URL (e.g., https://open.spotify.com/album/...)"
                         )
-                        if st.button("🔍 Search on Spotify", key=f"spotify_search_{row['Artist Name(s)']}_{row['Album Name']}"):
-                            search_url = f"https://open.spotify.com/search/{row['Artist Name(s)']}%20{row['Album Name']}"
-                            st.markdown(f'<a href="{search_url}" target="_blank">Open Spotify Search</a>', unsafe_allow_html=True)
+                        # Buttons other than submit aren't allowed in a form, so link the search directly
+                        search_url = f"https://open.spotify.com/search/{artist}%20{album}"
+                        st.markdown(f'<a href="{search_url}" target="_blank">🔍 Search on Spotify</a>', unsafe_allow_html=True)
                     
                     with cols[2]:
-                        if url:
-                            if st.button("Save", key=f"save_spotify_{row['Artist Name(s)']}_{row['Album Name']}"):
-                                # Create a new row for the dataframe
-                                new_row = {
-                                    'Album Name': row['Album Name'],
-                                    'Artist Name(s)': row['Artist Name(s)'],
-                                    'Spotify URL': url.replace('https://', '')  # Remove https:// prefix
-                                }
-                                
-                                # Check if this artist/album already exists
-                                existing_index = album_links_df[
-                                    (album_links_df['Artist Name(s)'] == row['Artist Name(s)']) & 
-                                    (album_links_df['Album Name'] == row['Album Name'])
-                                ].index
-                                
-                                if not existing_index.empty:
-                                    # Update existing entry
-                                    album_links_df.loc[existing_index, 'Spotify URL'] = new_row['Spotify URL']
-                                else:
-                                    # Add new entry
-                                    album_links_df = pd.concat([album_links_df, pd.DataFrame([new_row])], ignore_index=True)
-                                
-                                # Save the updated dataframe
-                                try:
-                                    album_links_df.to_csv('data/nmf_album_links.csv', index=False)
-                                    st.success("Saved!")
-                                    st.cache_data.clear()
-                                    st.rerun()
-                                except Exception as e:
-                                    st.error(f"Failed to save: {e}")
+                        save = st.form_submit_button("Save")
+                
+                if url and save:
+                    # Create a new row for the dataframe
+                    new_row = {
+                        'Album Name': album,
+                        'Artist Name(s)': artist,
+                        'Spotify URL': url.replace('https://', '')  # Remove https:// prefix
+                    }
+                    
+                    # Check if this artist/album already exists
+                    existing_rows = album_link_rows().get((artist, album), [])
+                    
+                    # Save: rewrite the file to update an existing entry, append a new one
+                    try:
+                        if len(existing_rows):
+                            album_links_df.iloc[existing_rows, album_links_df.columns.get_loc('Spotify URL')] = new_row['Spotify URL']
+                            write_csv_frame('data/nmf_album_links.csv', album_links_df, quoting=csv.QUOTE_MINIMAL)
+                        else:
+                            append_csv_record('data/nmf_album_links.csv', new_row)
+                        st.success("Saved!")
+                        load_album_links.clear()
+                        album_link_map.clear()
+                        album_link_rows.clear()
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Failed to save: {e}")
 
     with tab4:
         st.subheader("Nuke Albums")
         
-        # Load the current predictions data
-        predictions_data = load_predictions()
-        if predictions_data is None:
+        # Load the albums in the current predictions
+        all_albums = unique_albums()
+        if all_albums is None:
             st.error("Could not load prediction data. Please check the predictions folder.")
             return
         
-        df, _ = predictions_data
-        
-        # Load or create the nuked albums CSV
         nuked_albums_file = 'data/nuked_albums.csv'
-        if os.path.exists(nuked_albums_file):
-            nuked_albums_df = pd.read_csv(nuked_albums_file)
-        else:
-            nuked_albums_df = pd.DataFrame(columns=['Artist', 'Album Name', 'Reason'])
         
-        # Initialize session state for nuked albums if not already set
+        # Initialize session state for nuked albums if not already set. Nukes are appended
+        # to both the session list and the CSV, so the file is only read here.
         if 'nuked_albums' not in st.session_state:
+            if os.path.exists(nuked_albums_file):
+                nuked_albums_df = load_nuked_albums()
+            else:
+                nuked_albums_df = pd.DataFrame(columns=['Artist', 'Album Name', 'Reason'])
             st.session_state.nuked_albums = nuked_albums_df.to_dict('records')
+        # (Artist, Album Name) pairs of the nuked albums, for O(1) membership checks
+        if 'nuked_keys' not in st.session_state:
+            st.session_state.nuked_keys = {(nuked['Artist'], nuked['Album Name']) for nuked in st.session_state.nuked_albums}
         
         # Show statistics
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Total Albums", len(df))
+            st.metric("Total Albums", len(all_albums))
         with col2:
             st.metric("Nuked Albums", len(st.session_state.nuked_albums))
         
         # Suggest albums for nuking based on keywords
         st.subheader("Suggestions for Nuking")
-        keywords = ["Live", "Deluxe", "Reissue", "Anniversary"]
-        suggested_albums = df[
-            df['Album Name'].str.contains('|'.join(keywords), case=False, regex=True)
-        ]
+        suggested_albums = keyword_matches()
         
-        if not suggested_albums.empty:
+        if suggested_albums is not None and not suggested_albums.empty:
             st.write("Albums with keywords like 'Live', 'Deluxe', 'Reissue', or 'Anniversary':")
-            for idx, row in suggested_albums.iterrows():
-                # Check if the album has already been nuked
-                already_nuked = any(
-                    (nuked['Artist'] == row['Artist']) and (nuked['Album Name'] == row['Album Name'])
-                    for nuked in st.session_state.nuked_albums
-                )
-                
+            for artist, album in suggested_albums.itertuples(index=False, name=None):
                 # Only show the button if the album hasn't been nuked
-                if not already_nuked:
-                    if st.button(f"Nuke {row['Artist']} - {row['Album Name']}", key=f"suggested_nuke_{idx}"):
+                if (artist, album) not in st.session_state.nuked_keys:
+                    if st.button(f"Nuke {artist} - {album}", key=f"suggested_nuke_{artist}_{album}"):
                         # Add to nuked albums
                         new_nuke = {
-                            'Artist': row['Artist'],
-                            'Album Name': row['Album Name'],
+                            'Artist': artist,
+                            'Album Name': album,
                             'Reason': "Keyword match"
                         }
                         st.session_state.nuked_albums.append(new_nuke)
-                        nuked_albums_df = pd.DataFrame(st.session_state.nuked_albums)
-                        nuked_albums_df.to_csv(nuked_albums_file, index=False)
-                        st.success(f"Nuked {row['Artist']} - {row['Album Name']}")
+                        st.session_state.nuked_keys.add((artist, album))
+                        append_csv_record(nuked_albums_file, new_nuke)
+                        load_nuked_albums.clear()
+                        st.success(f"Nuked {artist} - {album}")
                         st.rerun()  # Refresh the page to update the UI
                 else:
-                    st.write(f"✅ {row['Artist']} - {row['Album Name']} has already been nuked.")
+                    st.write(f"✅ {artist} - {album} has already been nuked.")
         else:
             st.info("No albums found with keywords like 'Live', 'Deluxe', 'Reissue', or 'Anniversary'.")
         
         # Manual nuking
         st.subheader("Manually Nuke an Album")
-        all_albums = df[['Artist', 'Album Name']].drop_duplicates()
         selected_album_idx = st.selectbox(
             "Select an album to nuke:",
             options=range(len(all_albums)),
@@ -1222,8 +1366,9 @@ def album_fixer_page():
                     'Reason': reason if reason else "Manual nuke"
                 }
                 st.session_state.nuked_albums.append(new_nuke)
-                nuked_albums_df = pd.DataFrame(st.session_state.nuked_albums)
-                nuked_albums_df.to_csv(nuked_albums_file, index=False)
+                st.session_state.nuked_keys.add((artist, album))
+                append_csv_record(nuked_albums_file, new_nuke)
+                load_nuked_albums.clear()
                 st.success(f"Nuked {artist} - {album}")
                 st.rerun()
         
@@ -1240,6 +1385,10 @@ def album_fixer_page():
         # Load public feedback
         public_feedback_df = load_public_feedback()
         
+        # Case-insensitive "Mike-like" mask, computed once for every filter below
+        # (string dtype first: an empty or all-missing column isn't read as strings)
+        mike_like = public_feedback_df['Username'].astype('string').str.contains('mike', case=False, regex=False, na=False)
+        
         # Show statistics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -1250,10 +1399,7 @@ def album_fixer_page():
             st.metric("Mike's Reviews", len(public_feedback_df[public_feedback_df['Username'] == "Mike"]))
         with col4:
             # Count reviews with usernames similar to Mike (case insensitive)
-            mike_like_reviews = public_feedback_df[
-                public_feedback_df['Username'].str.lower().str.contains('mike')
-            ]
-            st.metric("Mike-like Reviews", len(mike_like_reviews))
+            st.metric("Mike-like Reviews", int(mike_like.sum()))
         
         if public_feedback_df.empty:
             st.info("No reviews found!")
@@ -1265,20 +1411,18 @@ def album_fixer_page():
             
             # Apply filter
             if filter_choice == "Anonymous Reviews Only":
-                filtered_reviews = public_feedback_df[public_feedback_df['Username'] == "Anonymous"].copy()
+                filtered_reviews = public_feedback_df[public_feedback_df['Username'] == "Anonymous"]
             elif filter_choice == "Mike's Reviews Only":
-                filtered_reviews = public_feedback_df[public_feedback_df['Username'] == "Mike"].copy()
+                filtered_reviews = public_feedback_df[public_feedback_df['Username'] == "Mike"]
             elif filter_choice == "Mike-like Reviews":
-                filtered_reviews = public_feedback_df[
-                    public_feedback_df['Username'].str.lower().str.contains('mike')
-                ].copy()
+                filtered_reviews = public_feedback_df[mike_like]
             elif filter_choice == "Other Users' Reviews":
                 filtered_reviews = public_feedback_df[
-                    (~public_feedback_df['Username'].str.lower().str.contains('mike')) & 
+                    (~mike_like) & 
                     (public_feedback_df['Username'] != "Anonymous")
-                ].copy()
+                ]
             else:
-                filtered_reviews = public_feedback_df.copy()
+                filtered_reviews = public_feedback_df
             
             # Sort options
             sort_options = ["Newest First", "Oldest First", "Album Name", "Artist Name"]
@@ -1286,10 +1430,8 @@ def album_fixer_page():
             
             # Apply sorting
             if sort_choice == "Newest First":
-                filtered_reviews['Timestamp'] = pd.to_datetime(filtered_reviews['Timestamp'])
                 filtered_reviews = filtered_reviews.sort_values('Timestamp', ascending=False)
             elif sort_choice == "Oldest First":
-                filtered_reviews['Timestamp'] = pd.to_datetime(filtered_reviews['Timestamp'])
                 filtered_reviews = filtered_reviews.sort_values('Timestamp', ascending=True)
             elif sort_choice == "Album Name":
                 filtered_reviews = filtered_reviews.sort_values('Album Name')
@@ -1299,29 +1441,31 @@ def album_fixer_page():
             # Display reviews with delete buttons
             st.subheader(f"Reviews ({len(filtered_reviews)})")
             
-            for idx, row in filtered_reviews.iterrows():
-                with st.container():
-                    cols = st.columns([3, 1, 1])
-                    
-                    with cols[0]:
-                        feedback_emoji = "👍" if row['Feedback'] == 'like' else "😐" if row['Feedback'] == 'mid' else "👎"
-                        review_text = f"\"{row['Review']}\"" if row['Review'] and not pd.isna(row['Review']) else "No review text"
-                        st.write(f"**{row['Artist']} - {row['Album Name']}** {feedback_emoji}")
-                        st.write(f"User: **{row['Username']}** | Date: {row['Timestamp']}")
-                        st.write(review_text)
-                    
-                    with cols[2]:
-                        if st.button("Delete", key=f"delete_review_{idx}"):
-                            # Remove this review
-                            public_feedback_df = public_feedback_df.drop(idx)
-                            
-                            # Save the updated dataframe
-                            public_feedback_df.to_csv('feedback/public_feedback.csv', index=False, quoting=1)
-                            st.success(f"Deleted review for {row['Artist']} - {row['Album Name']} by {row['Username']}")
-                            
-                            # Clear cache and rerun
-                            st.cache_data.clear()
-                            st.rerun()
+            # One data editor for the whole list (rendered and scrolled client-side)
+            # instead of a row of widgets per review; tick "Delete" to select reviews.
+            review_columns = ['Artist', 'Album Name', 'Feedback', 'Username', 'Timestamp', 'Review']
+            review_table = filtered_reviews[review_columns].assign(
+                Feedback=filtered_reviews['Feedback'].map(rating_emoji),
+                Delete=False
+            )
+            # Edits are stored by row position, so start fresh whenever the list changes
+            editor_key = f"reviews_editor_{filter_choice}_{sort_choice}"
+            edited = st.data_editor(
+                review_table,
+                column_config={"Delete": st.column_config.CheckboxColumn("Delete", default=False)},
+                disabled=review_columns,
+                hide_index=True,
+                use_container_width=True,
+                key=editor_key
+            )
+            
+            selected_ids = filtered_reviews.loc[edited.index[edited['Delete'].to_numpy(dtype=bool)], 'review_id']
+            if st.button(f"Delete {len(selected_ids)} Selected Reviews", disabled=selected_ids.empty):
+                # Remove these reviews (clears the public feedback caches)
+                delete_public_reviews(selected_ids)
+                st.session_state.pop(editor_key, None)
+                st.success(f"Deleted {len(selected_ids)} reviews")
+                st.rerun()
             
             # Add bulk delete options
             st.subheader("Bulk Delete Options")
@@ -1330,51 +1474,23 @@ def album_fixer_page():
             with bulk_options[0]:
                 if st.button("Delete All Anonymous Reviews"):
                     # Remove all anonymous reviews
-                    public_feedback_df = public_feedback_df[public_feedback_df['Username'] != "Anonymous"]
-                    
-                    # Save the updated dataframe
-                    public_feedback_df.to_csv('feedback/public_feedback.csv', index=False, quoting=1)
+                    delete_public_reviews(public_feedback_df.loc[public_feedback_df['Username'] == "Anonymous", 'review_id'])
                     st.success(f"Deleted all anonymous reviews")
-                    
-                    # Clear cache and rerun
-                    st.cache_data.clear()
                     st.rerun()
             
             with bulk_options[1]:
                 if st.button("Delete All Mike-like Reviews"):
-                    # Count before deletion
-                    count_before = len(public_feedback_df)
-                    
                     # Remove all reviews with usernames containing 'mike' (case insensitive)
-                    public_feedback_df = public_feedback_df[
-                        ~public_feedback_df['Username'].str.lower().str.contains('mike')
-                    ]
-                    
-                    # Count after deletion
-                    count_deleted = count_before - len(public_feedback_df)
-                    
-                    # Save the updated dataframe
-                    public_feedback_df.to_csv('feedback/public_feedback.csv', index=False, quoting=1)
-                    st.success(f"Deleted {count_deleted} Mike-like reviews")
-                    
-                    # Clear cache and rerun
-                    st.cache_data.clear()
+                    ids_to_delete = public_feedback_df.loc[mike_like, 'review_id']
+                    delete_public_reviews(ids_to_delete)
+                    st.success(f"Deleted {len(ids_to_delete)} Mike-like reviews")
                     st.rerun()
             
             with bulk_options[2]:
                 if st.button("Delete All Displayed Reviews"):
-                    # Get the indices of the filtered reviews
-                    indices_to_delete = filtered_reviews.index
-                    
-                    # Remove these reviews
-                    public_feedback_df = public_feedback_df.drop(indices_to_delete)
-                    
-                    # Save the updated dataframe
-                    public_feedback_df.to_csv('feedback/public_feedback.csv', index=False, quoting=1)
-                    st.success(f"Deleted {len(indices_to_delete)} displayed reviews")
-                    
-                    # Clear cache and rerun
-                    st.cache_data.clear()
+                    # Remove the filtered reviews
+                    delete_public_reviews(filtered_reviews['review_id'])
+                    st.success(f"Deleted {len(filtered_reviews)} displayed reviews")
                     st.rerun()
             
             with bulk_options[3]:
@@ -1382,16 +1498,25 @@ def album_fixer_page():
                     # Confirm deletion with a warning
                     st.warning("⚠️ This will delete ALL reviews! Are you sure?")
                     if st.button("Yes, Delete ALL Reviews", key="confirm_delete_all"):
-                        # Create empty dataframe with same columns
-                        empty_df = pd.DataFrame(columns=public_feedback_df.columns)
+                        # Create empty dataframe with the current columns
+                        empty_df = pd.DataFrame(columns=PUBLIC_FEEDBACK_COLUMNS)
                         
-                        # Save the empty dataframe
-                        empty_df.to_csv('feedback/public_feedback.csv', index=False, quoting=1)
+                        # Save the empty dataframe; with no reviews left the deleted ids are moot
+                        write_csv_frame('feedback/public_feedback.csv', empty_df)
+                        if os.path.exists(DELETED_REVIEWS_FILE):
+                            os.remove(DELETED_REVIEWS_FILE)
                         st.success(f"Deleted all {len(public_feedback_df)} reviews")
                         
-                        # Clear cache and rerun
-                        st.cache_data.clear()
+                        # Clear the public feedback cache and rerun
+                        refresh_public_feedback()
                         st.rerun()
+            
+            # Deletes above only append ids; fold them into the feedback file in one write
+            if os.path.exists(DELETED_REVIEWS_FILE):
+                if st.button("Save Deletions to Feedback File", key="compact_reviews"):
+                    compact_public_feedback()
+                    st.success("Rewrote public feedback without the deleted reviews")
+                    st.rerun()
 
     with tab6:
         # Import the data_backup_restore module
@@ -1404,7 +1529,11 @@ def album_fixer_page():
         except Exception as e:
             st.error(f"Error loading Data Backup & Restore tab: {e}")
 
-def dacus_game_page(G):
+def dacus_game_page(file_path=None, analysis_date=None):
+    artists = artist_network(file_path, analysis_date)[0]
+    all_artists = graph_artists(file_path, analysis_date)
+    dacus_tree = dacus_bfs_tree(file_path, analysis_date)
+    
     st.title("🎵 6 Degrees of Lucy Dacus")
     st.write("""
     ### How It Works
@@ -1412,16 +1541,13 @@ def dacus_game_page(G):
     The **Dacus number** is the number of connections between the artist and Lucy Dacus.
     """)
     
-    # Get all artists from the graph
-    all_artists = sorted(list(G.nodes()))
-    
     # Create a search box with autocomplete
     search_term = st.text_input("Search for an artist:", "")
     
     # Filter artists based on search term (case-insensitive)
     if search_term:
-        filtered_artists = [artist for artist in all_artists 
-                          if search_term.lower() in artist.lower()]
+        needle = search_term.lower()
+        filtered_artists = [artist for artist_lc, artist in all_artists if needle in artist_lc]
         
         # Display "no results" message if needed
         if not filtered_artists:
@@ -1444,7 +1570,7 @@ def dacus_game_page(G):
                           "Japanese Breakfast", "Mitski", "Big Thief", 
                           "The National", "Snail Mail", "Soccer Mommy"]
         # Ensure these artists are in the graph
-        popular_artists = [a for a in popular_artists if a in G.nodes()]
+        popular_artists = [a for a in popular_artists if a in artists]
         
         st.write("Or select from popular artists:")
         selected_artist = st.selectbox(
@@ -1458,7 +1584,7 @@ def dacus_game_page(G):
             return
     
     # Calculate Dacus number and path
-    dacus_number, path = calculate_dacus_number(selected_artist, G)
+    dacus_number, path = calculate_dacus_number(selected_artist, dacus_tree)
     
     if dacus_number is not None:
         st.success(f"**Dacus Number:** {dacus_number}")
@@ -1468,13 +1594,13 @@ def dacus_game_page(G):
         st.subheader("Network Path Visualization")
         with st.spinner("Generating network visualization..."):
             # Create a subgraph with the path and some neighbors for context
+            G = artist_graph(file_path, analysis_date)
             path_nodes = set(path)
             context_nodes = set()
             
             # Add some context nodes (neighbors of path nodes)
             for node in path:
-                neighbors = list(G.neighbors(node))[:3]  # Limit to 3 neighbors
-                context_nodes.update(neighbors)
+                context_nodes.update(islice(G.neighbors(node), 3))  # Limit to 3 neighbors
             
             all_viz_nodes = path_nodes.union(context_nodes)
             subgraph = G.subgraph(all_viz_nodes)
@@ -1485,124 +1611,217 @@ def dacus_game_page(G):
     else:
         st.error("No path found. This artist might not be connected to Lucy Dacus in our network.")
         
-def calculate_dacus_number(artist_name, G):
+def calculate_dacus_number(artist_name, dacus_tree):
     """
-    Calculate the Dacus number and path for a given artist.
+    Calculate the Dacus number and path for a given artist from the precomputed
+    BFS tree (see dacus_bfs_tree): a dict lookup plus a walk up the parents.
     """
-    try:
-        if artist_name not in G:
-            return None, None
-        
-        if artist_name == "Lucy Dacus":
-            return 0, ["Lucy Dacus"]
-        
-        path = nx.shortest_path(G, source=artist_name, target="Lucy Dacus")
-        dacus_number = len(path) - 1
-        return dacus_number, path
-    except nx.NetworkXNoPath:
+    distances, parents = dacus_tree
+    if artist_name not in distances:
         return None, None
+    
+    path = [artist_name]
+    while path[-1] != "Lucy Dacus":
+        path.append(parents[path[-1]])
+    return distances[artist_name], path
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def network_layout(nodes, edges):
+    """
+    spring_layout for a small subgraph, keyed on its sorted nodes and edges so
+    revisiting the same neighbourhood skips the solver.
+    """
+    import networkx as nx
+    
+    H = nx.Graph()
+    H.add_nodes_from(nodes)
+    H.add_edges_from(edges)
+    # Path-plus-neighbours subgraphs are small; 20 iterations settle them fine
+    return nx.spring_layout(H, seed=42, iterations=20 if len(nodes) <= 30 else 50)
 
 def visualize_artist_network(G, path):
     """
     Visualize the artist network and highlight the path to Lucy Dacus.
     """
-    pos = nx.spring_layout(G, seed=42)
+    import plotly.graph_objects as go
+    
+    pos = network_layout(tuple(sorted(G.nodes())),
+                         tuple(sorted(tuple(sorted(edge)) for edge in G.edges())))
     
-    edge_trace = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_trace.append(go.Scatter(
-            x=[x0, x1, None], y=[y0, y1, None],
-            line=dict(width=0.5, color='#888'),
-            hoverinfo='none',
-            mode='lines'
-        ))
+    def line_coords(edges):
+        # One trace per colour: segments joined with None breaks
+        xs, ys = [], []
+        for u, v in edges:
+            x0, y0 = pos[u]
+            x1, y1 = pos[v]
+            xs += [x0, x1, None]
+            ys += [y0, y1, None]
+        return xs, ys
     
+    edge_x, edge_y = line_coords(G.edges())
+    edge_trace = go.Scatter(
+        x=edge_x, y=edge_y,
+        line=dict(width=0.5, color='#888'),
+        hoverinfo='none',
+        mode='lines'
+    )
+    
+    nodes = list(G.nodes())
     node_trace = go.Scatter(
-        x=[], y=[], text=[], mode='markers+text', hoverinfo='text',
+        x=[pos[node][0] for node in nodes],
+        y=[pos[node][1] for node in nodes],
+        text=nodes, mode='markers+text', hoverinfo='text',
         marker=dict(size=10, color='lightblue'),
         textposition="top center"
     )
     
-    for node in G.nodes():
-        x, y = pos[node]
-        node_trace['x'] += (x,)
-        node_trace['y'] += (y,)
-        node_trace['text'] += (node,)
-    
     # Highlight the path
-    path_edges = list(zip(path[:-1], path[1:]))
-    path_trace = []
-    for edge in path_edges:
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        path_trace.append(go.Scatter(
-            x=[x0, x1, None], y=[y0, y1, None],
-            line=dict(width=2, color='red'),
-            hoverinfo='none',
-            mode='lines'
-        ))
-    
-    fig = go.Figure(data=edge_trace + [node_trace] + path_trace)
+    path_x, path_y = line_coords(zip(path[:-1], path[1:]))
+    path_trace = go.Scatter(
+        x=path_x, y=path_y,
+        line=dict(width=2, color='red'),
+        hoverinfo='none',
+        mode='lines'
+    )
+    
+    fig = go.Figure(data=[edge_trace, node_trace, path_trace])
     fig.update_layout(showlegend=False, hovermode='closest')
     return fig
 
-def build_graph(df, df_liked_similar, include_nmf=False):
+# Node types in build_artist_arrays, in the order a later type overrides an earlier one
+ARTIST_TYPES = ['liked', 'similar_liked', 'nmf', 'not_liked']
+
+def build_artist_arrays(df, df_liked_similar, include_nmf=False):
     """
-    Build a graph of artists and their connections.
+    Artists and their connections as flat arrays rather than a NetworkX graph.
     Only includes liked artists and their similar artists by default.
     Optionally includes NMF and not-liked artists (without adding edges).
+    Returns (artists, types, edges): a pd.Index of artist names, a Categorical of
+    each artist's type aligned with it (NaN for artists only seen in an edge),
+    and an (n_edges, 2) int32 array of positions in artists.
     """
-    G = nx.Graph()
+    # Split multi-artist credits once; each playlist origin below is a slice of this
+    has_artists = 'playlist_origin' in df.columns and 'Artist Name(s)' in df.columns
+    if has_artists:
+        artists = df[['playlist_origin']].assign(artist=df['Artist Name(s)'].str.split(',')).explode('artist')
+        artists['artist'] = artists['artist'].str.strip()
+        artists = artists.dropna(subset=['artist'])
     
-    # Add nodes for liked artists
-    if 'playlist_origin' in df.columns and 'Artist Name(s)' in df.columns:
-        liked_artists = set(
-            df[df['playlist_origin'].isin(['df_liked', 'df_fav_albums'])]['Artist Name(s)']
-            .str.split(',').explode().str.strip()
-        )
-    else:
-        liked_artists = set()  # Fallback if columns are missing
+    typed = {artist_type: pd.Series(dtype=object) for artist_type in ARTIST_TYPES}
     
-    G.add_nodes_from(liked_artists, type='liked')
+    # Liked artists
+    if has_artists:
+        typed['liked'] = artists.loc[artists['playlist_origin'].isin(['df_liked', 'df_fav_albums']), 'artist']
     
-    # Add nodes for similar artists (from liked)
+    # Similar artists (from liked)
     if 'Similar Artists' in df_liked_similar.columns:
-        similar_artists_liked = set(
-            df_liked_similar['Similar Artists']
-            .dropna()
-            .str.split(',').explode().str.strip()
-        )
-    else:
-        similar_artists_liked = set()  # Fallback if column is missing
-    
-    G.add_nodes_from(similar_artists_liked, type='similar_liked')
+        typed['similar_liked'] = (df_liked_similar['Similar Artists']
+                                  .dropna()
+                                  .str.split(',').explode().str.strip()
+                                  .dropna())
     
-    # Add edges based on similarity (from liked)
+    # Edges based on similarity (from liked)
+    endpoints = pd.Series(dtype=object)
     if 'Artist' in df_liked_similar.columns and 'Similar Artists' in df_liked_similar.columns:
-        for _, row in df_liked_similar.iterrows():
-            artist = row['Artist']
-            if isinstance(row['Similar Artists'], str):
-                similar = row['Similar Artists'].split(', ')
-                for s in similar:
-                    G.add_edge(artist, s, weight=1.0)
+        # One (artist, similar artist) row per edge; non-string entries split to NaN and are dropped
+        pairs = (df_liked_similar[['Artist']]
+                 .assign(similar=df_liked_similar['Similar Artists'].str.split(', '))
+                 .explode('similar')
+                 .dropna(subset=['Artist', 'similar']))
+        endpoints = pd.Series(pairs[['Artist', 'similar']].to_numpy().ravel())
     
     # Optionally include NMF and not-liked artists (without adding edges)
-    if include_nmf and 'playlist_origin' in df.columns and 'Artist Name(s)' in df.columns:
-        nmf_artists = set(
-            df[df['playlist_origin'] == 'df_nmf']['Artist Name(s)']
-            .str.split(',').explode().str.strip()
-        )
-        not_liked_artists = set(
-            df[df['playlist_origin'] == 'df_not_liked']['Artist Name(s)']
-            .str.split(',').explode().str.strip()
-        )
-        G.add_nodes_from(nmf_artists, type='nmf')
-        G.add_nodes_from(not_liked_artists, type='not_liked')
+    if include_nmf and has_artists:
+        typed['nmf'] = artists.loc[artists['playlist_origin'] == 'df_nmf', 'artist']
+        typed['not_liked'] = artists.loc[artists['playlist_origin'] == 'df_not_liked', 'artist']
+    
+    # Number every name once; edge endpoints sit between the similar and NMF artists,
+    # matching the order the graph used to add its nodes in
+    parts = [typed['liked'], typed['similar_liked'], endpoints, typed['nmf'], typed['not_liked']]
+    codes, uniques = pd.factorize(pd.concat(parts, ignore_index=True).to_numpy())
+    bounds = np.cumsum([0] + [len(part) for part in parts])
     
+    # Later types overwrite earlier ones, as repeated add_nodes_from(..., type=...) calls did
+    type_codes = np.full(len(uniques), -1, dtype=np.int8)
+    for type_code, part_idx in enumerate([0, 1, 3, 4]):  # the typed parts, skipping endpoints
+        type_codes[codes[bounds[part_idx]:bounds[part_idx + 1]]] = type_code
+    
+    edges = codes[bounds[2]:bounds[3]].astype(np.int32).reshape(-1, 2)
+    types = pd.Categorical.from_codes(type_codes, categories=ARTIST_TYPES)
+    return pd.Index(uniques), types, edges
+
+@st.cache_resource(show_spinner="Building the artist network...")
+def artist_network(file_path=None, analysis_date=None):
+    """
+    build_artist_arrays() for the given predictions file (latest if none specified) and
+    the liked-similar artists, built once per predictions file. None if there are no predictions.
+    """
+    predictions_data = load_predictions(file_path, analysis_date)
+    if predictions_data is None:
+        return None
+    df, _ = predictions_data
+    return build_artist_arrays(df, load_liked_similar(), include_nmf=True)
+
+def build_graph(network):
+    """
+    Materialize artist_network() arrays as a NetworkX graph.
+    """
+    import networkx as nx
+    
+    artists, _, edges = network
+    G = nx.Graph()
+    G.add_nodes_from(artists)
+    G.add_edges_from(zip(artists[edges[:, 0]], artists[edges[:, 1]]), weight=1.0)
     return G
 
+# The Dacus graph is read-only once built, so cache_resource shares one instance
+# instead of pickling a copy of every node and edge on each rerun like cache_data would.
+@st.cache_resource(show_spinner=False)
+def artist_graph(file_path=None, analysis_date=None):
+    """
+    NetworkX graph of artist_network(), built on first use by the path
+    visualization. None if there are no predictions.
+    """
+    network = artist_network(file_path, analysis_date)
+    return build_graph(network) if network is not None else None
+
+@st.cache_resource(show_spinner=False)
+def dacus_bfs_tree(file_path=None, analysis_date=None):
+    """
+    One breadth-first search from Lucy Dacus over artist_network()'s edges, run by
+    scipy on a sparse adjacency matrix rather than over the NetworkX graph. Returns
+    ({artist: Dacus number}, {artist: next artist on a shortest path to Lucy Dacus}).
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import breadth_first_order, shortest_path
+    
+    network = artist_network(file_path, analysis_date)
+    if network is None or "Lucy Dacus" not in network[0]:
+        return {}, {}
+    
+    artists, _, edges = network
+    n = len(artists)
+    # Duplicate edges just sum their weights, which an unweighted search ignores
+    adjacency = csr_matrix((np.ones(len(edges), dtype=np.float32), (edges[:, 0], edges[:, 1])), shape=(n, n))
+    dacus_idx = artists.get_loc("Lucy Dacus")
+    
+    order, predecessors = breadth_first_order(adjacency, dacus_idx, directed=False, return_predecessors=True)
+    hops = shortest_path(adjacency, directed=False, unweighted=True, indices=dacus_idx)
+    
+    # order holds every artist reachable from Lucy Dacus, starting with her
+    distances = dict(zip(artists[order], hops[order].astype(int).tolist()))
+    parents = dict(zip(artists[order[1:]], artists[predecessors[order[1:]]]))
+    return distances, parents
+
+@st.cache_resource(show_spinner=False)
+def graph_artists(file_path=None, analysis_date=None):
+    """
+    Sorted artist names of artist_network() as (lowercased, original) pairs, so the
+    Dacus page's search doesn't lowercase every artist on each keystroke.
+    """
+    network = artist_network(file_path, analysis_date)
+    return [(artist.lower(), artist) for artist in sorted(network[0])] if network is not None else []
+
 def main():
     st.sidebar.title("About This Project")
     st.sidebar.write("""
@@ -1622,6 +1841,7 @@ def main():
     # Add the "Clear Cache and Refresh Data" button
     if st.sidebar.button("Clear Cache and Refresh Data"):
         st.cache_data.clear()
+        st.cache_resource.clear()
         st.rerun()
     
     # Navigation
@@ -1647,17 +1867,23 @@ def main():
         
         # Get the current date for display
         if len(file_dates) > 1:
-            current_date = file_dates[st.session_state.current_archive_index][2]
-            selected_file = file_dates[st.session_state.current_archive_index][0]
+            selected_file, _, current_date, selected_date = file_dates[st.session_state.current_archive_index]
         else:
             # If only one file, use it
-            selected_file = file_dates[0][0] if file_dates else None
-            current_date = file_dates[0][2] if file_dates else "Unknown"
-        
-        # Load the selected predictions file
-        predictions_data = load_predictions(selected_file)
-        album_covers_df = load_album_covers()
-        similar_artists_df = load_similar_artists()
+            selected_file, _, current_date, selected_date = file_dates[0] if file_dates else (None, None, "Unknown", None)
+        
+        # Load the selected predictions file and everything the album cards need in parallel.
+        # The cards' own loader calls are then cache hits.
+        page_data = prefetch_data([
+            ('predictions', lambda: load_predictions(selected_file, selected_date)),
+            ('nuked', load_nuked_albums),
+            ('covers', album_cover_map),
+            ('links', album_link_map),
+            ('similar', similar_artist_map),
+            ('feedback', feedback_index),
+            ('public', get_public_feedback_index),
+        ])
+        predictions_data = page_data['predictions']
         
         if predictions_data is None:
             st.error("Could not load prediction data. Please check the predictions folder.")
@@ -1666,21 +1892,16 @@ def main():
         df, analysis_date = predictions_data
         
         # Load nuked albums
-        nuked_albums_df = load_nuked_albums()
+        nuked_albums_df = page_data['nuked']
         
         # Filter out nuked albums
         if not nuked_albums_df.empty:
-            df = df[~df.apply(lambda row: (
-                (row['Artist'] in nuked_albums_df['Artist'].values) &
-                (row['Album Name'] in nuked_albums_df['Album Name'].values)
-            ), axis=1)]
+            nuked_keys = pd.MultiIndex.from_frame(nuked_albums_df[['Artist', 'Album Name']])
+            df = df[~pd.MultiIndex.from_frame(df[['Artist', 'Album Name']]).isin(nuked_keys)]
         
         # Fixed the genre counting logic
-        all_genres = set()
-        for genres_str in df['Genres']:
-            if isinstance(genres_str, str):
-                genres_list = [g.strip() for g in genres_str.split(',')]
-                all_genres.update(genres_list)
+        album_genres = genre_sets(selected_file, selected_date).loc[df.index]
+        all_genres = frozenset().union(*album_genres)
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -1692,39 +1913,22 @@ def main():
         
         st.subheader("🏆 Top Album Predictions")
         
-        # Filter out genres that contain numbers or have more than 2 words
-        filtered_genres = []
-        for genre in all_genres:
-            # Skip if it contains any digits
-            if any(char.isdigit() for char in genre):
-                continue
-                
-            # Count words (treating hyphenated words as separate)
-            # Replace hyphens with spaces first, then count words
-            modified_genre = genre.replace('-', ' ')
-            word_count = len(modified_genre.split())
-            
-            # Only include if it has 2 or fewer words
-            if word_count <= 2:
-                filtered_genres.append(genre)
-
         genres = st.multiselect(
             "Filter by Genre",
-            options=sorted(filtered_genres),
+            options=filter_genre_options(tuple(sorted(all_genres))),
             default=[]
         )
 
 
         
         if genres:
-            filtered_data = df[
-                df['Genres'].apply(lambda x: any(genre in x for genre in genres))
-            ]
+            selected_genres = set(genres)
+            filtered_data = df[album_genres.map(lambda album: not album.isdisjoint(selected_genres))]
         else:
             filtered_data = df
         
         filtered_data = filtered_data.sort_values('avg_score', ascending=False)
-        display_album_predictions(filtered_data, album_covers_df, similar_artists_df)
+        display_album_predictions(filtered_data)
         
         # Archive navigation at the bottom of the page
         if len(file_dates) > 1:
@@ -1760,7 +1964,7 @@ def main():
                 # Show all archives if requested
                 if st.session_state.get("show_all_archives", False):
                     st.markdown("### All Available Archives")
-                    for i, (_, _, date_str) in enumerate(file_dates):
+                    for i, (_, _, date_str, _) in enumerate(file_dates):
                         if st.button(date_str, key=f"archive_{i}"):
                             st.session_state.current_archive_index = i
                             st.session_state.show_all_archives = False
@@ -1782,6 +1986,7 @@ def main():
                 html_content = f.read()
             
             st.markdown('<div class="notebook-content">', unsafe_allow_html=True)
+            import streamlit.components.v1 as components
             components.html(html_content, height=800, scrolling=True)
             st.markdown('</div>', unsafe_allow_html=True)
         except Exception as e:
@@ -1791,23 +1996,13 @@ def main():
         about_me_page()
     
     elif page == "6 Degrees of Lucy Dacus":
-        # Load the liked similar artists dataset
-        df_liked_similar = load_liked_similar()
-        
-        # Use the latest predictions for the graph
-        latest_file = file_dates[0][0] if file_dates else None
-        predictions_data = load_predictions(latest_file)
-        
-        if predictions_data is None:
+        # Use the latest predictions for the graph; built once per predictions file
+        latest_file, _, _, latest_date = file_dates[0] if file_dates else (None, None, None, None)
+        if artist_network(latest_file, latest_date) is None:
             st.error("Could not load prediction data. Please check the predictions folder.")
             return
-            
-        df, _ = predictions_data
-        
-        # Load the artist network graph (G)
-        G = build_graph(df, df_liked_similar, include_nmf=True)
         
-        dacus_game_page(G)
+        dacus_game_page(latest_file, latest_date)
 
 if __name__ == "__main__":
     try:
@@ -1822,8 +2017,3 @@ if __name__ == "__main__":
         st.error("An error occurred during application execution:")
         st.error(str(e))
         st.code(traceback.format_exc())
-
-except Exception as e:
-    st.error("An error occurred during application startup:")
-    st.error(str(e))
-    st.code(traceback.format_exc())